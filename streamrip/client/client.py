@@ -3,6 +3,7 @@
 import asyncio
 import contextlib
 import logging
+import weakref
 from abc import ABC, abstractmethod
 
 import aiohttp
@@ -17,6 +18,62 @@ DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:83.0) Gecko/20100101 Firefox/83.0"
 )
 
+# One connection pool per event loop and SSL setting, shared by every client
+# session so that keep-alive connections are reused across sources
+_shared_connectors: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# Seconds resolved hostnames are reused for. API and CDN hosts stay the same for
+# a whole run, so they don't need to be looked up again every few seconds
+CONNECTOR_DNS_TTL = 300
+
+
+def get_shared_connector(verify_ssl: bool = True) -> aiohttp.TCPConnector:
+    """Return the connector shared by all client sessions on the running loop."""
+    connectors = _shared_connectors.setdefault(asyncio.get_running_loop(), {})
+    connector = connectors.get(verify_ssl)
+    if connector is None or connector.closed:
+        connector_kwargs = get_aiohttp_connector_kwargs(verify_ssl=verify_ssl)
+        # Concurrency is bounded by the clients' own limiters (max_connections),
+        # so aiohttp's default pool size (100, unlimited per host) is kept
+        connector = aiohttp.TCPConnector(ttl_dns_cache=CONNECTOR_DNS_TTL, **connector_kwargs)
+        connectors[verify_ssl] = connector
+    return connector
+
+
+async def close_shared_connectors():
+    """Close the connectors created by `get_shared_connector` on the running loop."""
+    connectors = _shared_connectors.pop(asyncio.get_running_loop(), {})
+    for connector in connectors.values():
+        await connector.close()
+
+
+class CombinedLimiter:
+    """Concurrency limit and request rate limit as one async context manager.
+
+    Either limit is disabled when its value is not positive.
+    """
+
+    def __init__(self, max_concurrent: int, requests_per_min: int):
+        self._semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent > 0 else None
+        self._rate_limiter = (
+            aiolimiter.AsyncLimiter(requests_per_min, 60) if requests_per_min > 0 else None
+        )
+
+    async def __aenter__(self):
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+        if self._rate_limiter is not None:
+            try:
+                await self._rate_limiter.acquire()
+            except BaseException:
+                if self._semaphore is not None:
+                    self._semaphore.release()
+                raise
+        return self
+
+    async def __aexit__(self, *_):
+        if self._semaphore is not None:
+            self._semaphore.release()
+
 
 class Client(ABC):
     source: str
@@ -41,6 +98,31 @@ class Client(ABC):
     async def get_downloadable(self, item: str, quality: int) -> Downloadable:
         raise NotImplementedError
 
+    async def prefetch_tracks(self, item_ids: list[str]):
+        """Fetch per-track download info for a whole tracklist ahead of time.
+
+        No-op by default. Clients whose API supports batched lookups override
+        this so that later `get_metadata`/`get_downloadable` calls for these
+        ids don't need their own round-trip.
+        """
+        return None
+
+    async def iter_user_favorites(self, media_type: str, user_id: str | None = None):
+        """Yield a user's favorited items of `media_type` as they are fetched.
+
+        By default this yields the items of `get_user_favorites` once it
+        returns. Clients with paginated favorites override this to yield each
+        page as soon as it arrives.
+        """
+        resp = await self.get_user_favorites(media_type, user_id=user_id)
+        for item in resp.get("items") or ():
+            yield item
+
+    async def close(self):
+        """Release the resources held by the client."""
+        if hasattr(self, "session"):
+            await self.session.close()
+
     @staticmethod
     def get_rate_limiter(
         requests_per_min: int,
@@ -58,11 +140,10 @@ class Client(ABC):
         if headers is None:
             headers = {}
 
-        # Get connector kwargs based on SSL verification setting
-        connector_kwargs = get_aiohttp_connector_kwargs(verify_ssl=verify_ssl)
-        connector = aiohttp.TCPConnector(**connector_kwargs)
-
+        # Sessions keep their own headers (clients add auth headers to them),
+        # but share the underlying connection pool, which they don't own
         return aiohttp.ClientSession(
             headers={"User-Agent": DEFAULT_USER_AGENT} | headers,
-            connector=connector,
+            connector=get_shared_connector(verify_ssl),
+            connector_owner=False,
         )
@@ -1,11 +1,16 @@
 import asyncio
 import binascii
+import functools
 import hashlib
 import logging
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import deezer
 import requests
 from Cryptodome.Cipher import AES
+from requests.adapters import DEFAULT_POOLSIZE
 
 from ..config import Config
 from ..exceptions import (
@@ -13,15 +18,39 @@ from ..exceptions import (
     MissingCredentialsError,
     NonStreamableError,
 )
-from .client import Client
+from .client import Client, CombinedLimiter
 from .downloadable import DeezerDownloadable
 
 logger = logging.getLogger("streamrip")
-logging.captureWarnings(True)
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# In-memory cache of API responses, so that tracks from the same album and
+# get_track -> get_downloadable sequences don't repeat requests
+API_CACHE_SIZE = 4096
+API_CACHE_TTL = 300  # seconds
+
+# Deezer format names and gw filesize fields, indexed by generic quality int
+QUALITY_FORMATS = ("MP3_128", "MP3_320", "FLAC")
+FILESIZE_KEYS = ("FILESIZE_MP3_128", "FILESIZE_MP3_320", "FILESIZE_FLAC")
+
+# ECB with a fixed key is stateless, so one cipher can be shared
+_DEEZER_URL_CIPHER = AES.new(b"jo6aey6haid2Teih", AES.MODE_ECB)
+
+
+def _orjson_response_hook(resp: requests.Response, *_, **__) -> requests.Response:
+    """Decode deezer-py's API responses with orjson instead of the stdlib."""
+    resp.json = lambda **_: orjson.loads(resp.content)
+    return resp
 
 
 class DeezerClient(Client):
-    """Client to handle deezer API. Does not do rate limiting.
+    """Client to handle deezer API.
 
     Attributes:
         global_config: Entire config object
@@ -36,6 +65,9 @@ class DeezerClient(Client):
     max_quality = 2
 
     def __init__(self, config: Config):
+        # Route warnings from deezer-py/urllib3 through logging. Done here rather
+        # than at import so importing the module has no global side effects.
+        logging.captureWarnings(True)
         self.global_config = config
         self.logged_in = False
         self._login_lock = asyncio.Lock()
@@ -47,20 +79,48 @@ class DeezerClient(Client):
         
         # Create deezer client and configure its requests session with proper connection pool size
         self.client = deezer.Deezer()
-        
-        # Configure the requests session connection pool size to match max_connections
+        self._mount_http_adapter(max_connections)
+        if HAS_ORJSON:
+            self.client.session.hooks["response"].append(_orjson_response_hook)
+
+        # deezer-py is synchronous, so API calls run on a dedicated pool sized
+        # to match the connection pool instead of the default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_connections if max_connections > 0 else None,
+            thread_name_prefix="deezer-api",
+        )
+
+        # Concurrency limit from config, plus rate limit
+        # (Deezer API limit: 10 requests/second = 600 requests/minute)
+        self.limiter = CombinedLimiter(max_connections, requests_per_minute)
+        # (endpoint, item_id) -> (expiry, future), see `_cached_api_call`
+        self._api_cache: OrderedDict[tuple[str, str], tuple[float, asyncio.Future]] = (
+            OrderedDict()
+        )
+
+    def _mount_http_adapter(self, max_connections: int):
+        """Share one keep-alive connection pool, sized to match max_connections,
+        across every requests session deezer-py uses for the api and gw endpoints.
+        """
+        pool_size = max_connections if max_connections > 0 else DEFAULT_POOLSIZE
         adapter = requests.adapters.HTTPAdapter(
-            pool_connections=max_connections,
-            pool_maxsize=max_connections,
-            max_retries=0
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=0,
+            pool_block=False,
         )
-        self.client.session.mount('http://', adapter)
-        self.client.session.mount('https://', adapter)
-        
-        # Rate limit: 10 requests/second = 600 requests/minute (Deezer API limit)
-        self.rate_limiter = self.get_rate_limiter(requests_per_minute)
-        # Concurrency limit using config value
-        self.concurrency_limiter = asyncio.Semaphore(max_connections)
+        sessions = {
+            id(session): session
+            for session in (
+                self.client.session,
+                getattr(self.client.api, "session", None),
+                getattr(self.client.gw, "session", None),
+            )
+            if session is not None
+        }
+        for session in sessions.values():
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
 
     async def login(self):
         # Used for track downloads
@@ -77,12 +137,106 @@ class DeezerClient(Client):
 
     async def _api_call(self, func, *args, **kwargs):
         """Wrapper for deezer API calls with rate and concurrency limiting."""
-        async with self.concurrency_limiter:
-            async with self.rate_limiter:
-                # Handle mocks directly without threading for tests
-                if hasattr(func, '_mock_name') or str(type(func).__name__) == 'MagicMock':
-                    return func(*args, **kwargs)
-                return await asyncio.to_thread(func, *args, **kwargs)
+        async with self.limiter:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+
+    async def close(self):
+        await super().close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _cached_api_call(self, endpoint: str, func, item_id):
+        """Call `func(item_id)` through `_api_call`, caching the result."""
+        return await self._cached(endpoint, item_id, lambda: self._api_call(func, item_id))
+
+    async def _cached(self, endpoint: str, item_id, make_request):
+        """Await `make_request()`, caching the result under (endpoint, item_id).
+
+        Concurrent callers for the same key share one in-flight request.
+        Failures are not cached.
+        """
+        key = (endpoint, str(item_id))
+        now = time.monotonic()
+        entry = self._api_cache.get(key)
+        if entry is not None and entry[0] > now:
+            self._api_cache.move_to_end(key)
+            fut = entry[1]
+        else:
+            fut = asyncio.ensure_future(make_request())
+            self._cache_put(key, fut, now)
+
+        try:
+            return await asyncio.shield(fut)
+        except Exception:
+            entry = self._api_cache.get(key)
+            if entry is not None and entry[1] is fut:
+                del self._api_cache[key]
+            raise
+
+    def _cache_put(self, key: tuple[str, str], fut: asyncio.Future, now: float):
+        self._api_cache[key] = (now + API_CACHE_TTL, fut)
+        self._api_cache.move_to_end(key)
+        while len(self._api_cache) > API_CACHE_SIZE:
+            self._api_cache.popitem(last=False)
+
+    def _cache_invalidate(self, endpoint: str, item_id):
+        self._api_cache.pop((endpoint, str(item_id)), None)
+
+    async def _get_tracklist(self, func, item_id) -> list[dict]:
+        """Fetch a complete album/playlist tracklist.
+
+        Tracklists are requested with limit=-1, which normally returns
+        everything at once. If Deezer paginates anyway, the remaining pages
+        are requested concurrently rather than by following `next` links.
+        """
+        resp = await self._api_call(func, item_id)
+        tracks = resp["data"]
+        total = resp.get("total", len(tracks))
+        page_size = len(tracks)
+        if page_size == 0 or page_size >= total:
+            return tracks
+
+        pages = await asyncio.gather(
+            *(
+                self._api_call(func, item_id, index=index, limit=page_size)
+                for index in range(page_size, total, page_size)
+            )
+        )
+        for page in pages:
+            tracks.extend(page["data"])
+        return tracks
+
+    async def _get_album_tracks(self, album_id) -> list[dict]:
+        return await self._cached(
+            "api.get_album_tracks",
+            album_id,
+            lambda: self._get_tracklist(self.client.api.get_album_tracks, album_id),
+        )
+
+    async def prefetch_tracks(self, item_ids: list[str]):
+        """Fetch gw info for all `item_ids` with a single song.getListData call."""
+        if not item_ids:
+            return
+        try:
+            tracks = await self._api_call(self.client.gw.get_tracks, list(item_ids))
+        except Exception as e:
+            logger.debug("Bulk gw track fetch failed, falling back to per-track calls: %s", e)
+            return
+
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+        for track_info in tracks:
+            sng_id = track_info.get("SNG_ID")
+            if sng_id:
+                fut = loop.create_future()
+                fut.set_result(track_info)
+                self._cache_put(("gw.get_track", str(sng_id)), fut, now)
+
+    async def _get_gw_track(self, item_id: str) -> dict:
+        return await self._cached_api_call(
+            "gw.get_track", self.client.gw.get_track, item_id
+        )
 
     async def get_metadata(self, item_id: str, media_type: str) -> dict:
         # TODO: open asyncio PR to deezer py and integrate
@@ -106,16 +260,18 @@ class DeezerClient(Client):
         album_id = item["album"]["id"]
         try:
             album_metadata, album_tracks, detailed_track_info = await asyncio.gather(
-                self._api_call(self.client.api.get_album, album_id),
-                self._api_call(self.client.api.get_album_tracks, album_id),
-                self._api_call(self.client.gw.get_track, item_id),
+                self._cached_api_call("api.get_album", self.client.api.get_album, album_id),
+                self._get_album_tracks(album_id),
+                self._get_gw_track(item_id),
             )
         except Exception as e:
-            logger.error(f"Error fetching album of track {item_id}: {e}")
+            logger.error("Error fetching album of track %s: %s", item_id, e)
             return item
 
-        album_metadata["tracks"] = album_tracks["data"]
-        album_metadata["track_total"] = len(album_tracks["data"])
+        # cached responses are shared, so don't mutate them in place
+        album_metadata = dict(album_metadata)
+        album_metadata["tracks"] = album_tracks
+        album_metadata["track_total"] = len(album_tracks)
         item["album"] = album_metadata
         item["qualities"] = [ None, None, None]
         # Add detailed track info with composer/author data if available
@@ -127,29 +283,29 @@ class DeezerClient(Client):
                 if "author" in contributors:
                     item["author"] = contributors["author"]
             item["qualities"] = [
-                ("FILESIZE_MP3_128" if int(detailed_track_info.get("FILESIZE_MP3_128", 0)) != 0 else None),
-                ("FILESIZE_MP3_320" if int(detailed_track_info.get("FILESIZE_MP3_320", 0)) != 0 else None),
-                ("FILESIZE_FLAC" if int(detailed_track_info.get("FILESIZE_FLAC", 0)) != 0 else None),
+                key if int(detailed_track_info.get(key) or 0) != 0 else None
+                for key in FILESIZE_KEYS
             ]
 
         return item
 
     async def get_album(self, item_id: str) -> dict:
         album_metadata, album_tracks = await asyncio.gather(
-            self._api_call(self.client.api.get_album, item_id),
-            self._api_call(self.client.api.get_album_tracks, item_id),
+            self._cached_api_call("api.get_album", self.client.api.get_album, item_id),
+            self._get_album_tracks(item_id),
         )
-        album_metadata["tracks"] = album_tracks["data"]
-        album_metadata["track_total"] = len(album_tracks["data"])
+        album_metadata = dict(album_metadata)
+        album_metadata["tracks"] = album_tracks
+        album_metadata["track_total"] = len(album_tracks)
         return album_metadata
 
     async def get_playlist(self, item_id: str) -> dict:
         pl_metadata, pl_tracks = await asyncio.gather(
             self._api_call(self.client.api.get_playlist, item_id),
-            self._api_call(self.client.api.get_playlist_tracks, item_id),
+            self._get_tracklist(self.client.api.get_playlist_tracks, item_id),
         )
-        pl_metadata["tracks"] = pl_tracks["data"]
-        pl_metadata["track_total"] = len(pl_tracks["data"])
+        pl_metadata["tracks"] = pl_tracks
+        pl_metadata["track_total"] = len(pl_tracks)
         return pl_metadata
 
     async def get_artist(self, item_id: str) -> dict:
@@ -215,13 +371,11 @@ class DeezerClient(Client):
             raise NonStreamableError(
                 "No item id provided. This can happen when searching for fallback songs.",
             )
-        # TODO: optimize such that all of the ids are requested at once
         dl_info: dict = {"quality": quality, "id": item_id}
 
         # Map generic quality int to Deezer-specific format
-        quality_map = ["MP3_128", "MP3_320", "FLAC"]
-        format_str = quality_map[quality]
-        track_info = await self._api_call(self.client.gw.get_track, item_id)
+        format_str = QUALITY_FORMATS[quality]
+        track_info = await self._get_gw_track(item_id)
         fallback_id = track_info.get("FALLBACK", {}).get("SNG_ID")
         
         dl_info["quality"] = quality
@@ -231,12 +385,14 @@ class DeezerClient(Client):
             logger.debug("Fetching deezer url with token %s", token)
             url = self.client.get_track_url(token, format_str)
         except deezer.WrongLicense:
+            self._cache_invalidate("gw.get_track", item_id)
             raise NonStreamableError(
                 "The requested quality is not available with your subscription. "
                 "Deezer HiFi is required for quality 2. Otherwise, the maximum "
                 "quality allowed is 1.",
             )
         except deezer.WrongGeolocation:
+            self._cache_invalidate("gw.get_track", item_id)
             if not is_retry and fallback_id:
                 return await self.get_downloadable(fallback_id, quality, is_retry=True)
             raise NonStreamableError(
@@ -271,18 +427,13 @@ class DeezerClient(Client):
                 str(media_version).encode(),
             ),
         )
-        url_hash = hashlib.md5(url_bytes).hexdigest()
-        info_bytes = bytearray(url_hash.encode())
-        info_bytes.extend(b"\xa4")
-        info_bytes.extend(url_bytes)
-        info_bytes.extend(b"\xa4")
+        url_hash = binascii.hexlify(hashlib.md5(url_bytes, usedforsecurity=False).digest())
+        info_bytes = b"\xa4".join((url_hash, url_bytes, b""))
         # Pad the bytes so that len(info_bytes) % 16 == 0
         padding_len = 16 - (len(info_bytes) % 16)
-        info_bytes.extend(b"." * padding_len)
+        info_bytes += b"." * padding_len
 
-        path = binascii.hexlify(
-            AES.new(b"jo6aey6haid2Teih", AES.MODE_ECB).encrypt(info_bytes),
-        ).decode("utf-8")
+        path = binascii.hexlify(_DEEZER_URL_CIPHER.encrypt(info_bytes)).decode("utf-8")
         url = f"https://e-cdns-proxy-{track_hash[0]}.dzcdn.net/mobile/1/{path}"
         logger.debug("Encrypted file path %s", url)
         return url
@@ -71,7 +71,9 @@ class Downloadable(ABC):
         await self._download(path, callback)
 
     async def size(self) -> int:
-        if hasattr(self, "_size") and self._size is not None:
+        # Cached after the first lookup (or download), so callers can ask
+        # repeatedly without another request
+        if self._size is not None:
             return self._size
 
         async with self.session.head(self.url) as response:
@@ -199,7 +201,7 @@ class DeezerDownloadable(Downloadable):
         :param track_id:
         :type track_id: str
         """
-        md5_hash = hashlib.md5(track_id.encode()).hexdigest()
+        md5_hash = hashlib.md5(track_id.encode(), usedforsecurity=False).hexdigest()
         # good luck :)
         return "".join(
             chr(functools.reduce(lambda x, y: x ^ y, map(ord, t)))
@@ -243,6 +245,7 @@ class TidalDownloadable(Downloadable):
         if self.is_segmented:
             self.segment_urls = url
             self.url = url[0] if url else None  # For size() method
+            self._size_base = None
         else:
             self.url = url
             self.segment_urls = None
@@ -360,7 +363,7 @@ class SoundcloudDownloadable(Downloadable):
         return tmp
 
     async def size(self) -> int:
-        if self.file_type == "mp3":
+        if self.file_type == "mp3" and self._size is None:
             async with self.session.get(self.url) as resp:
                 content = await resp.text("utf-8")
 
@@ -1,11 +1,12 @@
 import asyncio
 import base64
+import contextlib
 import hashlib
 import logging
 import re
 import time
 from collections import OrderedDict
-from typing import List, Optional
+from typing import AsyncGenerator, List, Optional
 
 import aiohttp
 
@@ -24,6 +25,8 @@ from .downloadable import BasicDownloadable, Downloadable
 logger = logging.getLogger("streamrip")
 
 QOBUZ_BASE_URL = "https://www.qobuz.com/api.json/0.2"
+# Times a rate limited (429) request is retried, waiting 1, 2, 4... seconds
+RATE_LIMIT_RETRIES = 3
 
 
 
@@ -337,22 +340,42 @@ class QobuzClient(Client):
         epoint = "album/getFeatured"
         return await self._paginate(epoint, params, limit=limit)
 
-    async def get_user_favorites(self, media_type: str, user_id: str = None, limit: int = 500) -> dict:
+    async def get_user_favorites(
+        self, media_type: str, user_id: str | None = None, limit: int = 500
+    ) -> dict:
         # Qobuz doesn't use user_id - it uses authenticated user, so we ignore the user_id parameter
         assert media_type in ("tracks", "albums", "artists")
         params = {"type": f"{media_type}"}
         epoint = "favorite/getUserFavorites"
 
-        resp = await self._paginate(epoint, params, limit=limit)
-        
+        pages = await self._paginate(epoint, params, limit=limit)
+
         # Standardize response format - Qobuz returns {media_type: {items: [...]}}
-        # Extract items from the nested structure
-        if isinstance(resp, list) and len(resp) > 0 and media_type in resp[0]:
-            section = resp[0][media_type]
-            if "items" in section and section["items"]:
-                return {"items": section["items"]}
-        
-        return {"items": []}
+        # on every page
+        return {
+            "items": [
+                item
+                for page in pages
+                for item in page.get(media_type, {}).get("items") or ()
+            ]
+        }
+
+    async def iter_user_favorites(
+        self, media_type: str, user_id: str | None = None, limit: int = 500
+    ):
+        """Yield favorited items page by page, as each page's request completes.
+
+        Like `get_user_favorites`, at most `limit` items are fetched.
+        """
+        assert media_type in ("tracks", "albums", "artists")
+        params = {"type": media_type}
+        epoint = "favorite/getUserFavorites"
+
+        pages = self._iter_pages(epoint, params, limit=limit, ordered=False)
+        async with contextlib.aclosing(pages):
+            async for page in pages:
+                for item in page.get(media_type, {}).get("items") or ():
+                    yield item
 
     async def get_user_playlists(self, limit: int = 500) -> list[dict]:
         epoint = "playlist/getUserPlaylists"
@@ -388,12 +411,28 @@ class QobuzClient(Client):
         """Paginate search results.
 
         params:
-            limit: If None, all the results are yielded. Otherwise a maximum
-            of `limit` results are yielded.
+            limit: If None, all the results are returned. Otherwise a maximum
+            of `limit` results are returned.
 
         Returns
         -------
-            Generator that yields (status code, response) tuples
+            List of the response pages, in order
+        """
+        return [page async for page in self._iter_pages(epoint, params, limit=limit)]
+
+    async def _iter_pages(
+        self,
+        epoint: str,
+        params: dict,
+        limit: int = 500,
+        ordered: bool = True,
+    ) -> AsyncGenerator[dict, None]:
+        """Yield the response pages of a paginated endpoint.
+
+        The first page is requested alone to learn the total, then the rest
+        are requested concurrently. They are yielded in order, or as each
+        request completes if `ordered` is False. Requests still in flight are
+        cancelled when the caller stops iterating early.
         """
         params.update({"limit": limit})
         status, page = await self._api_request(epoint, params)
@@ -412,28 +451,29 @@ class QobuzClient(Client):
 
         if total == 0:
             logger.debug("Nothing found from %s epoint", epoint)
-            return []
+            return
 
-        limit = int(page.get(key, {}).get("limit", 500))
-        offset = int(page.get(key, {}).get("offset", 0))
+        limit = int(items.get("limit", 500))
+        offset = int(items.get("offset", 0))
 
         logger.debug("paginate: from response: limit=%d, offset=%d", limit, offset)
         params.update({"limit": limit})
 
-        pages = []
-        requests = []
-        assert status == 200, status
-        pages.append(page)
+        tasks = []
         while (offset + limit) < total:
             offset += limit
             params.update({"offset": offset})
-            requests.append(self._api_request(epoint, params.copy()))
-
-        for status, resp in await asyncio.gather(*requests):
-            assert status == 200
-            pages.append(resp)
-
-        return pages
+            tasks.append(asyncio.ensure_future(self._api_request(epoint, params.copy())))
+
+        try:
+            yield page
+            for task in tasks if ordered else asyncio.as_completed(tasks):
+                status, resp = await task
+                assert status == 200, status
+                yield resp
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def _get_app_id_and_secrets(self) -> tuple[str, list[str]]:
         async with QobuzSpoofer(
@@ -487,9 +527,14 @@ class QobuzClient(Client):
         """
         url = f"{QOBUZ_BASE_URL}/{epoint}"
         logger.debug("api_request: endpoint=%s, params=%s", epoint, params)
-        async with self.rate_limiter:
-            async with self.session.get(url, params=params) as response:
-                return response.status, await response.json()
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            async with self.rate_limiter:
+                async with self.session.get(url, params=params) as response:
+                    if response.status != 429 or attempt == RATE_LIMIT_RETRIES:
+                        return response.status, await response.json()
+            wait_time = 2**attempt
+            logger.warning("Rate limited on %s, waiting %ds", epoint, wait_time)
+            await asyncio.sleep(wait_time)
 
     @staticmethod
     def get_quality(quality: int):
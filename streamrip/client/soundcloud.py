@@ -241,8 +241,9 @@ class SoundcloudClient(Client):
             _params.update(params)
 
         logger.debug(f"Requesting {url} with {_params=}, {headers=}")
-        async with self.session.get(url, params=_params, headers=headers) as resp:
-            return await resp.json(), resp.status
+        async with self.rate_limiter:
+            async with self.session.get(url, params=_params, headers=headers) as resp:
+                return await resp.json(), resp.status
 
     async def _request_body(self, url, params=None, headers=None):
         c = self.config
@@ -254,8 +255,9 @@ class SoundcloudClient(Client):
         if params is not None:
             _params.update(params)
 
-        async with self.session.get(url, params=_params, headers=headers) as resp:
-            return await resp.content.read(), resp.status
+        async with self.rate_limiter:
+            async with self.session.get(url, params=_params, headers=headers) as resp:
+                return await resp.content.read(), resp.status
 
     async def _announce_success(self):
         url = f"{BASE}/announcements"
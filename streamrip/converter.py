@@ -4,6 +4,7 @@ import asyncio
 import logging
 import os
 import shutil
+import weakref
 from tempfile import gettempdir
 from typing import Final, Optional
 
@@ -13,6 +14,22 @@ logger = logging.getLogger("streamrip")
 
 SAMPLING_RATES = {44100, 48000, 88200, 96000, 176400, 192000}
 
+# FFmpeg is CPU bound, so running more encoders than cores only makes them
+# compete with each other and with the event loop
+MAX_CONCURRENT_CONVERSIONS = os.cpu_count() or 1
+
+_conversion_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _conversion_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore bounding FFmpeg processes on the running loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _conversion_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONVERSIONS)
+        _conversion_semaphores[loop] = semaphore
+    return semaphore
+
 
 class Converter:
     """Base class for audio codecs."""
@@ -84,17 +101,22 @@ class Converter:
         self.command = self._gen_command()
         logger.debug("Generated conversion command: %s", self.command)
 
-        process = await asyncio.create_subprocess_exec(
-            *self.command,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        out, err = await process.communicate()
-        if process.returncode == 0 and os.path.isfile(self.tempfile):
+        async with _conversion_semaphore():
+            process = await asyncio.create_subprocess_exec(
+                *self.command,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            out, err = await process.communicate()
+        if process.returncode == 0 and await asyncio.to_thread(
+            os.path.isfile, self.tempfile
+        ):
+            # Filesystem calls run in a thread: the move crosses devices when
+            # the temp dir is on another mount and can take as long as a copy
             if self.remove_source:
-                os.remove(self.filename)
+                await asyncio.to_thread(os.remove, self.filename)
                 logger.debug("Source removed: %s", self.filename)
 
-            shutil.move(self.tempfile, self.final_fn)
+            await asyncio.to_thread(shutil.move, self.tempfile, self.final_fn)
             logger.debug("Moved: %s -> %s", self.tempfile, self.final_fn)
         else:
             raise ConversionError(f"FFmpeg output:\n{out, err}")
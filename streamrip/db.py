@@ -4,11 +4,14 @@ import logging
 import os
 import sqlite3
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Final
 
 logger = logging.getLogger("streamrip")
 
+# Lowest default limit on host parameters per statement across sqlite versions
+SQLITE_MAX_PARAMS = 999
+
 
 class DatabaseInterface(ABC):
     @abstractmethod
@@ -19,6 +22,10 @@ class DatabaseInterface(ABC):
     def contains(self, **items) -> bool:
         pass
 
+    @abstractmethod
+    def contains_many(self, key: str, values, **items) -> set[str]:
+        pass
+
     @abstractmethod
     def add(self, kvs):
         pass
@@ -41,6 +48,9 @@ class Dummy(DatabaseInterface):
     def contains(self, **_):
         return False
 
+    def contains_many(self, *_, **__):
+        return set()
+
     def add(self, *_):
         pass
 
@@ -109,6 +119,42 @@ class DatabaseBase(DatabaseInterface):
 
             return bool(conn.execute(command, tuple(items.values())).fetchone()[0])
 
+    def contains_many(self, key: str, values, **items) -> set[str]:
+        """Return the subset of `values` present in column `key`, in one query
+        per batch of SQLITE_MAX_PARAMS values.
+
+        :param key: column name
+        :param values: values to look up, compared as strings
+        :param items: additional column-name + expected value conditions
+        :rtype: set[str]
+        """
+        allowed_keys = set(self.structure.keys())
+        assert all(
+            k in allowed_keys for k in (key, *items.keys())
+        ), f"Invalid key. Valid keys: {allowed_keys}"
+
+        values = list(dict.fromkeys(str(v) for v in values))
+        found: set[str] = set()
+        if not values:
+            return found
+
+        conditions = "".join(f" AND {k}=?" for k in items.keys())
+        params = tuple(str(v) for v in items.values())
+        batch_size = SQLITE_MAX_PARAMS - len(params)
+
+        with sqlite3.connect(self.path) as conn:
+            for i in range(0, len(values), batch_size):
+                batch = values[i : i + batch_size]
+                question_marks = ", ".join("?" for _ in batch)
+                command = (
+                    f"SELECT {key} FROM {self.name} "
+                    f"WHERE {key} IN ({question_marks}){conditions}"
+                )
+                logger.debug("Executing %s", command)
+                found.update(row[0] for row in conn.execute(command, (*batch, *params)))
+
+        return found
+
     def add(self, items: tuple[str]):
         """Add a row to the table.
 
@@ -197,11 +243,27 @@ class Database:
     failed: DatabaseInterface
     releases: DatabaseInterface
 
+    # Every downloaded id, loaded from the table on first use so that lookups
+    # don't need a query each
+    _downloaded_ids: set[str] | None = field(default=None, init=False, repr=False)
+
+    def _downloaded_cache(self) -> set[str]:
+        if self._downloaded_ids is None:
+            self._downloaded_ids = {str(row[0]) for row in self.downloads.all()}
+        return self._downloaded_ids
+
     def downloaded(self, item_id: str) -> bool:
-        return self.downloads.contains(id=item_id)
+        return str(item_id) in self._downloaded_cache()
+
+    def downloaded_many(self, item_ids) -> set[str]:
+        """Return the ids in `item_ids` (as strings) that are marked downloaded."""
+        return self._downloaded_cache().intersection(map(str, item_ids))
 
     def set_downloaded(self, item_id: str):
         self.downloads.add((item_id,))
+        # With the database disabled, nothing counts as downloaded
+        if not isinstance(self.downloads, Dummy):
+            self._downloaded_cache().add(str(item_id))
 
     def get_failed_downloads(self) -> list[tuple[str, str, str]]:
         return self.failed.all()
@@ -213,6 +275,10 @@ class Database:
         """Check if entire release is already downloaded."""
         return self.releases.contains(id=release_id, type=media_type, source=source)
 
+    def releases_downloaded(self, release_ids, media_type: str, source: str) -> set[str]:
+        """Return the ids in `release_ids` (as strings) already fully downloaded."""
+        return self.releases.contains_many("id", release_ids, type=media_type, source=source)
+
     def set_release_downloaded(self, release_id: str, media_type: str, source: str, track_count: int):
         """Mark entire release as downloaded."""
         from datetime import datetime
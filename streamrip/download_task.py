@@ -7,7 +7,7 @@ if TYPE_CHECKING:
     from .media import Media, PendingSingle
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadTask:
     """Represents a download task for the global queue."""
     track: 'PendingSingle'  # The track to download
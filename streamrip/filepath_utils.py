@@ -1,8 +1,12 @@
-from string import printable
+from functools import lru_cache
+from string import ascii_letters, digits, printable
 
 from pathvalidate import sanitize_filename, sanitize_filepath  # type: ignore
 
-ALLOWED_CHARS = set(printable)
+ALLOWED_CHARS = frozenset(printable)
+# Characters that are valid in file names on every platform. Names made only of
+# these are returned by pathvalidate unchanged, so they skip sanitizing
+SAFE_FILENAME_CHARS = frozenset(ascii_letters + digits + " -_,&'()!+")
 
 
 # TODO: remove this when new pathvalidate release arrives with https://github.com/thombashi/pathvalidate/pull/48
@@ -12,7 +16,19 @@ def truncate_str(text: str) -> str:
     return str_bytes.decode(errors="ignore")
 
 
+# Album, artist and folder names repeat across every track of a release, so
+# sanitized results are memoized instead of re-running pathvalidate each time
+@lru_cache(maxsize=4096)
 def clean_filename(fn: str, restrict: bool = False) -> str:
+    # Names of up to 4 characters could be reserved device names (CON, COM1)
+    # and leading or trailing spaces are stripped, so those are still sanitized
+    if (
+        4 < len(fn) <= 255
+        and fn[0] != " "
+        and fn[-1] != " "
+        and SAFE_FILENAME_CHARS.issuperset(fn)
+    ):
+        return fn
     path = truncate_str(str(sanitize_filename(fn)))
     if restrict:
         path = "".join(c for c in path if c in ALLOWED_CHARS)
@@ -20,6 +36,7 @@ def clean_filename(fn: str, restrict: bool = False) -> str:
     return path
 
 
+@lru_cache(maxsize=1024)
 def clean_filepath(fn: str, restrict: bool = False) -> str:
     path = str(sanitize_filepath(fn))
     if restrict:
@@ -64,7 +64,8 @@ class Album(Media):
 
         # Check if all tracks in album were successfully downloaded
         track_ids = [track.id for track in self.tracks]
-        downloaded_tracks = sum(1 for track_id in track_ids if self.db.downloaded(track_id))
+        downloaded = self.db.downloaded_many(track_ids)
+        downloaded_tracks = sum(1 for track_id in track_ids if str(track_id) in downloaded)
         total_tracks = len(track_ids)
 
         # Only mark complete if ALL tracks succeeded
@@ -115,15 +116,21 @@ class PendingAlbum(Pending):
         tracklist = [track["id"] for track in resp["tracks"]]
         
         # Check if all tracks are already downloaded (edge case for pre-optimization downloads)
-        all_tracks_downloaded = all(self.db.downloaded(track_id) for track_id in tracklist)
-        if all_tracks_downloaded and len(tracklist) > 0:
+        downloaded = self.db.downloaded_many(tracklist)
+        remaining = [track_id for track_id in tracklist if str(track_id) not in downloaded]
+        if not remaining and len(tracklist) > 0:
             logger.info(f"Album {self.id} has all tracks already downloaded - marking as complete")
             self.db.set_release_downloaded(self.id, "album", self.client.source, len(tracklist))
             return None
-        
+
         folder = self.config.session.downloads.folder
         album_folder = self._album_folder(folder, meta)
-        os.makedirs(album_folder, exist_ok=True)
+        # Create the folder off the event loop while the client batches its
+        # per-track lookups (one request instead of one per track, where supported)
+        await asyncio.gather(
+            asyncio.to_thread(os.makedirs, album_folder, exist_ok=True),
+            self.client.prefetch_tracks(remaining),
+        )
         embed_cover, _ = await download_artwork(
             self.client.session,
             album_folder,
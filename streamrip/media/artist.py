@@ -1,7 +1,10 @@
 import asyncio
+import functools
 import logging
 import re
+from collections import defaultdict
 from dataclasses import dataclass
+from operator import itemgetter
 
 from ..client import Client
 from ..config import Config, QobuzDiscographyFilterConfig
@@ -14,10 +17,33 @@ from .media import CollectionMedia, Pending
 
 logger = logging.getLogger("streamrip")
 
-# Resolve only N albums at a time to avoid
-# initial latency of resolving ALL albums and tracks
-# before any downloads
-RESOLVE_CHUNK_SIZE = 10
+# Discographies larger than this are filtered in a worker thread
+THREADED_FILTER_THRESHOLD = 200
+
+# Classifies album titles in a single scan. Each match's `lastgroup` tells
+# which kind of keyword was found.
+_ALBUM_TAG_RE = re.compile(
+    r"(?i)(?P<extra>anniversary|deluxe|live|collector|demo|expanded|remix)"
+    r"|(?P<remaster>(?:re)?master(?:ed)?)"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _album_tags(title: str) -> frozenset[str]:
+    """Return which of "extra" and "remaster" keywords appear in `title`."""
+    return frozenset(m.lastgroup for m in _ALBUM_TAG_RE.finditer(title))
+
+
+@functools.lru_cache(maxsize=4096)
+def _essence(title: str) -> str:
+    """Normalized album title with any bracketed or parenthesized suffix removed."""
+    end = len(title)
+    for c in "([":
+        i = title.find(c)
+        if 0 <= i < end:
+            end = i
+    # Titles that start with a bracket have no prefix to compare on
+    return (title[:end] if end else title).strip().lower()
 
 
 @dataclass(slots=True)
@@ -53,54 +79,68 @@ class Artist(CollectionMedia):
         This is used if the repeat filter is turned on, since we need the titles
         of all albums to remove repeated items.
         """
-        resolved_or_none: list[Album | None] = await asyncio.gather(
-            *[album.resolve() for album in self.albums]
-        )
-        resolved = [a for a in resolved_or_none if a is not None]
-        filtered_albums = self._apply_filters(resolved, filters)
-        batches = self.batch([a.rip() for a in filtered_albums], RESOLVE_CHUNK_SIZE)
-        for batch in batches:
-            await asyncio.gather(*batch)
+
+        async def _resolve(index: int, item: PendingAlbum):
+            return index, await item.resolve()
+
+        # Collect albums as their resolves finish, so one failed album is
+        # logged and dropped instead of aborting the whole discography
+        resolved: list[tuple[int, Album]] = []
+        for coro in asyncio.as_completed(
+            [_resolve(i, album) for i, album in enumerate(self.albums)]
+        ):
+            try:
+                index, album = await coro
+            except Exception as e:
+                logger.error(f"Error resolving album from artist {self.name}: {e}")
+                continue
+            if album is not None:
+                resolved.append((index, album))
+
+        # Restore discography order so ties between repeats resolve the same
+        # way regardless of which request returned first
+        resolved.sort(key=itemgetter(0))
+        albums = [a for _, a in resolved]
+        if len(albums) > THREADED_FILTER_THRESHOLD:
+            # Filtering is pure, so large discographies can be filtered off
+            # the event loop while other downloads keep making progress
+            filtered_albums = await asyncio.to_thread(
+                self._apply_filters, albums, filters
+            )
+        else:
+            filtered_albums = self._apply_filters(albums, filters)
+        await self._run_concurrent(filtered_albums, Album.rip)
 
     async def _download_async(self, filters: QobuzDiscographyFilterConfig):
-        async def _rip(item: PendingAlbum):
-            album = await item.resolve()
-            # Skip if album doesn't pass the filter
-            if (
-                album is None
-                or (filters.extras and not self._extras(album))
-                or (filters.features and not self._features(album))
-                or (filters.non_studio_albums and not self._non_studio_albums(album))
-                or (filters.non_remaster and not self._non_remaster(album))
-            ):
-                return
-            await album.rip()
-
-        batches = self.batch(
-            [_rip(album) for album in self.albums],
-            RESOLVE_CHUNK_SIZE,
-        )
-        for batch in batches:
-            await asyncio.gather(*batch)
+        await self._download_concurrent(self._predicates(filters))
+
+    def _predicates(self, filt: QobuzDiscographyFilterConfig) -> list:
+        """Return the enabled per-album filter predicates.
+
+        Plain string comparisons come before the regex-based checks so that
+        `all()` can short-circuit on the cheap ones first.
+        """
+        return [
+            predicate
+            for enabled, predicate in (
+                (filt.features, self._features),
+                (filt.non_studio_albums, self._non_studio_albums),
+                (filt.extras, self._extras),
+                (filt.non_remaster, self._non_remaster),
+            )
+            if enabled
+        ]
 
     def _apply_filters(
         self, albums: list[Album], filt: QobuzDiscographyFilterConfig
     ) -> list[Album]:
-        _albums = albums
+        # Repeats must be removed first since they depend on the whole list
         if filt.repeats:
-            _albums = self._filter_repeats(_albums)
-        if filt.extras:
-            _albums = filter(self._extras, _albums)
-        if filt.features:
-            _albums = filter(self._features, _albums)
-        if filt.non_studio_albums:
-            _albums = filter(self._non_studio_albums, _albums)
-        if filt.non_remaster:
-            _albums = filter(self._non_remaster, _albums)
-        return list(_albums)
-
-    # Will not fail on any nonempty string
-    _essence_re = re.compile(r"([^\(\[]+)(?:\s*[\(\[][^\)][\)\]])*")
+            albums = self._filter_repeats(albums)
+        predicates = self._predicates(filt)
+        if not predicates:
+            return albums
+        return [a for a in albums if all(p(a) for p in predicates)]
 
     @classmethod
     def _filter_repeats(cls, albums: list[Album]) -> list[Album]:
@@ -109,43 +149,26 @@ class Artist(CollectionMedia):
 
         It determines that two albums are identical if they have the same title
         ignoring contents in brackets or parentheses.
+
+        This is a pure function of `albums` and only uses module-level helpers,
+        so it is safe to call from a worker thread.
         """
-        groups: dict[str, list[Album]] = {}
+        # Prefer higher bit depth, then higher sampling rate, then explicit.
+        # The ranking key is computed once per album as it is grouped
+        groups: defaultdict[str, list[tuple[tuple, Album]]] = defaultdict(list)
         for a in albums:
-            match = cls._essence_re.match(a.meta.album)
-            assert match is not None
-            title = match.group(1).strip().lower()
-            items = groups.get(title, [])
-            items.append(a)
-            groups[title] = items
-
-        unique_albums: list[Album] = []
-        for group in groups.values():
-            # Move explicit versions to the beginning
-            group = sorted(
-                group,
-                key=lambda album: album.meta.info.explicit,
-                reverse=True,
-            )
-            group = sorted(
-                group,
-                key=lambda album: album.meta.info.sampling_rate or 0,
-                reverse=True,
-            )
-            group = sorted(
-                group,
-                key=lambda album: album.meta.info.bit_depth or 0,
-                reverse=True,
-            )
-            # group guaranteed to be nonempty
-            unique_albums.append(group[0])
+            meta = a.meta
+            info = meta.info
+            rank = (info.bit_depth or 0, info.sampling_rate or 0, info.explicit)
+            groups[_essence(meta.album)].append((rank, a))
+
+        # max() keeps the first of equally ranked albums
+        unique_albums: list[Album] = [
+            max(group, key=itemgetter(0))[1] for group in groups.values()
+        ]
 
         return unique_albums
 
-    _extra_re = re.compile(
-        r"(?i)(anniversary|deluxe|live|collector|demo|expanded|remix)"
-    )
-
     # ----- Filter predicates -----
     def _non_studio_albums(self, a: Album) -> bool:
         """Filter out non studio albums."""
@@ -158,26 +181,18 @@ class Artist(CollectionMedia):
     def _extras(self, a: Album) -> bool:
         """Filter out extras.
 
-        See `_extra_re` for criteria.
+        See `_ALBUM_TAG_RE` for criteria.
         """
-        return self._extra_re.search(a.meta.album) is None
-
-    _remaster_re = re.compile(r"(?i)(re)?master(ed)?")
+        return "extra" not in _album_tags(a.meta.album)
 
     def _non_remaster(self, a: Album) -> bool:
         """Filter out albums that are not remasters."""
-        return self._remaster_re.search(a.meta.album) is not None
+        return "remaster" in _album_tags(a.meta.album)
 
     def _non_albums(self, a: Album) -> bool:
         """Filter out singles."""
         return len(a.tracks) > 1
 
-    @staticmethod
-    def batch(iterable, n=1):
-        total = len(iterable)
-        for ndx in range(0, total, n):
-            yield iterable[ndx : min(ndx + n, total)]
-
 
 @dataclass(slots=True)
 class PendingArtist(Pending):
@@ -237,11 +252,20 @@ class PendingArtist(Pending):
             )
             return
 
-        album_ids = meta.album_ids()
         artist_name = meta.name
+        # Drop fully downloaded albums up front with one query, before any
+        # of them is resolved
+        album_ids = self.new_album_ids(
+            meta.album_ids(), self.db, self.client.source, artist_name, self.id
+        )
+        if not album_ids:
+            return
 
         # Get filters for this artist
         filter_conf = self.config.session.qobuz_filters
+        # Albums are yielded rather than downloaded by an Artist, but it owns
+        # the filtering logic
+        artist = Artist(artist_name, [], self.client, self.config, self.id, self.db)
 
         # If repeat filtering is enabled, we need to resolve all albums first
         # to detect duplicates. Otherwise we can stream them.
@@ -259,19 +283,15 @@ class PendingArtist(Pending):
             valid_albums = [a for a in resolved_albums if isinstance(a, Album)]
 
             # Apply filters including repeat removal
-            filtered_albums = self._apply_filters_to_albums(valid_albums, filter_conf, artist_name)
+            filtered_albums = artist._apply_filters(valid_albums, filter_conf)
 
             # Yield filtered albums
             for album in filtered_albums:
                 yield album
         else:
             # Stream albums one by one, applying filters as we go
+            predicates = artist._predicates(filter_conf)
             for album_id in album_ids:
-                # Check if already downloaded
-                if self.db.downloaded(album_id):
-                    logger.debug(f"Album {album_id} already downloaded, skipping")
-                    continue
-
                 try:
                     pending_album = PendingAlbum(album_id, self.client, self.config, self.db)
                     album = await pending_album.resolve()
@@ -280,44 +300,9 @@ class PendingArtist(Pending):
                         continue
 
                     # Apply filters (except repeats which requires all albums)
-                    if self._should_include_album(album, filter_conf, artist_name):
+                    if all(p(album) for p in predicates):
                         yield album
 
                 except Exception as e:
                     logger.error(f"Error resolving album {album_id}: {e}")
                     continue
-
-    def _apply_filters_to_albums(self, albums: list[Album], filters, artist_name: str) -> list[Album]:
-        """Apply all filters to a list of albums (used when repeat filtering is enabled)."""
-        _albums = albums
-        if filters.repeats:
-            _albums = Artist._filter_repeats(_albums)
-        if filters.extras:
-            _albums = [a for a in _albums if self._extras_for_album(a)]
-        if filters.features:
-            _albums = [a for a in _albums if a.meta.albumartist == artist_name]
-        if filters.non_studio_albums:
-            _albums = [a for a in _albums if a.meta.albumartist != "Various Artists" and self._extras_for_album(a)]
-        if filters.non_remaster:
-            _albums = [a for a in _albums if self._non_remaster_for_album(a)]
-        return _albums
-
-    def _should_include_album(self, album: Album, filters, artist_name: str) -> bool:
-        """Check if an individual album should be included (for streaming mode)."""
-        if filters.extras and not self._extras_for_album(album):
-            return False
-        if filters.features and album.meta.albumartist != artist_name:
-            return False
-        if filters.non_studio_albums and (album.meta.albumartist == "Various Artists" or not self._extras_for_album(album)):
-            return False
-        if filters.non_remaster and not self._non_remaster_for_album(album):
-            return False
-        return True
-
-    def _extras_for_album(self, album: Album) -> bool:
-        """Filter out extras for a single album."""
-        return Artist._extra_re.search(album.meta.album) is None
-
-    def _non_remaster_for_album(self, album: Album) -> bool:
-        """Check if album is a remaster."""
-        return Artist._remaster_re.search(album.meta.album) is not None
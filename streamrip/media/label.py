@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from dataclasses import dataclass
 
@@ -29,33 +28,11 @@ class Label(CollectionMedia):
         pass
 
     async def download(self):
-        # Resolve only 3 albums at a time to avoid
-        # initial latency of resolving ALL albums and tracks
-        # before any downloads
-        album_resolve_chunk_size = 10
-
-        async def _resolve_download(item: PendingAlbum):
-            album = await item.resolve()
-            if album is None:
-                return
-            await album.rip()
-
-        batches = self.batch(
-            [_resolve_download(album) for album in self.albums],
-            album_resolve_chunk_size,
-        )
-        for batch in batches:
-            await asyncio.gather(*batch)
+        await self._download_concurrent()
 
     async def postprocess(self):
         self._mark_collection_complete(self.label_id, "label")
 
-    @staticmethod
-    def batch(iterable, n=1):
-        total = len(iterable)
-        for ndx in range(0, total, n):
-            yield iterable[ndx : min(ndx + n, total)]
-
 
 @dataclass(slots=True)
 class PendingLabel(Pending):
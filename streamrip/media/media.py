@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
+import asyncio
 import logging
 
 logger = logging.getLogger("streamrip")
 
+# Resolve only N albums at a time to avoid
+# initial latency of resolving ALL albums and tracks
+# before any downloads
+RESOLVE_CHUNK_SIZE = 10
+
 
 class Media(ABC):
     @property
@@ -50,19 +56,30 @@ class Pending(ABC):
         """
         if not album_ids:
             return False
-            
+        return not Pending.new_album_ids(album_ids, db, source, entity_name, entity_id)
+
+    @staticmethod
+    def new_album_ids(album_ids: list[str], db, source: str, entity_name: str, entity_id: str) -> list[str]:
+        """Return the albums in `album_ids` not yet fully downloaded, logging
+        how many are new.
+
+        All albums are looked up with a single database query.
+        """
+        if not album_ids:
+            return []
+
+        downloaded = db.releases_downloaded(album_ids, "album", source)
         new_albums = [
             album_id for album_id in album_ids
-            if not db.release_downloaded(album_id, "album", source)
+            if str(album_id) not in downloaded
         ]
         
         if len(new_albums) == 0:
             logger.info(f"{entity_name} ({entity_id}) - all {len(album_ids)} albums already downloaded")
-            return True
         elif len(new_albums) < len(album_ids):
             logger.info(f"{entity_name} ({entity_id}) - found {len(new_albums)} new albums to download")
         
-        return False
+        return new_albums
 
 
 class CollectionMedia(Media):
@@ -73,3 +90,37 @@ class CollectionMedia(Media):
         if entity_id and self.db and hasattr(self, 'albums') and len(self.albums) > 0:
             self.db.set_release_downloaded(entity_id, entity_type, self.source_name, len(self.albums))
             logger.info(f"{entity_type.title()} {entity_id} processed ({len(self.albums)} albums) - marked as complete")
+
+    async def _download_concurrent(self, predicates=()):
+        """Resolve and rip `self.albums`, skipping albums failing any of `predicates`."""
+
+        async def _resolve_download(item):
+            album = await item.resolve()
+            if album is None or not all(p(album) for p in predicates):
+                return
+            await album.rip()
+
+        await self._run_concurrent(self.albums, _resolve_download)
+
+    async def _run_concurrent(self, items, handler):
+        """Await `handler(item)` for every item, keeping RESOLVE_CHUNK_SIZE in flight.
+
+        A fixed pool of workers drains a queue, so a new item starts as soon as
+        any finishes and the number of live coroutines is bounded by the pool
+        size rather than the collection size. One failing item doesn't abort
+        the rest.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in items:
+            queue.put_nowait(item)
+
+        async def _worker():
+            while not queue.empty():
+                item = queue.get_nowait()
+                try:
+                    await handler(item)
+                except Exception as e:
+                    logger.error(f"Error downloading album from {self.name}: {e}")
+
+        num_workers = min(RESOLVE_CHUNK_SIZE, queue.qsize())
+        await asyncio.gather(*(_worker() for _ in range(num_workers)))
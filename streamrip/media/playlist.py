@@ -128,34 +128,28 @@ class Playlist(Media):
         progress.remove_title(self.name)
 
     async def download(self):
+        # Max number of tracks being resolved/downloaded at once
         track_resolve_chunk_size = 20
 
-        async def _resolve_download(item: PendingPlaylistTrack):
-            try:
-                track = await item.resolve()
-                if track is None:
-                    return
-                await track.rip()
-            except Exception as e:
-                logger.error(f"Error downloading track: {e}")
-
-        batches = self.batch(
-            [_resolve_download(track) for track in self.tracks],
-            track_resolve_chunk_size,
-        )
-
-        for batch in batches:
-            results = await asyncio.gather(*batch, return_exceptions=True)
-
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Batch processing error: {result}")
-
-    @staticmethod
-    def batch(iterable, n=1):
-        total = len(iterable)
-        for ndx in range(0, total, n):
-            yield iterable[ndx : min(ndx + n, total)]
+        queue: asyncio.Queue[PendingPlaylistTrack] = asyncio.Queue()
+        for track in self.tracks:
+            queue.put_nowait(track)
+
+        async def _worker():
+            while not queue.empty():
+                item = queue.get_nowait()
+                try:
+                    track = await item.resolve()
+                    if track is None:
+                        continue
+                    await track.rip()
+                except Exception as e:
+                    logger.error(f"Error downloading track: {e}")
+
+        # A fixed pool of workers drains the queue, so the number of live
+        # coroutines is bounded by the pool size rather than the tracklist
+        num_workers = min(track_resolve_chunk_size, len(self.tracks))
+        await asyncio.gather(*(_worker() for _ in range(num_workers)))
 
 
 @dataclass(slots=True)
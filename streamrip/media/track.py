@@ -1,8 +1,13 @@
 import asyncio
 import logging
 import os
+import shutil
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
 
+import aiohttp
+
 from .. import converter
 from ..client import Client, Downloadable
 from ..config import Config
@@ -10,7 +15,8 @@ from ..console import console
 from ..db import Database
 from ..exceptions import NonStreamableError
 from ..filepath_utils import clean_filename
-from ..metadata import AlbumMetadata, Covers, TrackMetadata, tag_file
+from ..metadata import AlbumMetadata, TrackMetadata, tag_file
+from ..metadata.tagger import TAGGABLE_EXTENSIONS
 from ..progress import add_title, get_progress_callback, remove_title
 from ..utils.audio_validator import validate_audio_file
 from .artwork import download_artwork
@@ -18,6 +24,33 @@ from .media import Media, Pending
 
 logger = logging.getLogger("streamrip")
 
+# Times a track download is attempted before it is marked as failed
+DOWNLOAD_ATTEMPTS = 2
+# Seconds to wait before the first retry, doubled for every later one
+DOWNLOAD_RETRY_BACKOFF = 0.5
+
+# Cover downloads started by singles on each event loop, keyed by
+# (source, album id, folder), so that singles from the same album (e.g. liked
+# tracks) share one artwork download. Artwork temp dirs are removed when a
+# run's loop finishes, so the cached paths are only valid on that loop. Only
+# the most recently used albums are kept, and failed downloads are dropped so
+# that the next single retries them.
+COVER_CACHE_SIZE = 256
+_cover_tasks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# Track downloads in progress on each event loop, keyed by (source, track id).
+# Compilations share tracks with the original releases, so when albums being
+# downloaded together contain the same track, it is downloaded once and copied
+# into every other album's folder, which then tags its copy itself.
+_track_downloads: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _delete_if_exists(path: str) -> bool:
+    """Remove `path` if it exists. Returns whether a file was removed."""
+    if not os.path.exists(path):
+        return False
+    os.remove(path)
+    return True
+
 
 @dataclass(slots=True)
 class Track(Media):
@@ -34,100 +67,152 @@ class Track(Media):
 
     async def preprocess(self):
         self._set_download_path()
-        if not self.config.session.cli.dry_run:
-            os.makedirs(self.folder, exist_ok=True)
         if self.is_single:
             add_title(self.meta.title)
+        if not self.config.session.cli.dry_run:
+            # Probe the file size (cached by the downloadable for `download`)
+            # while the folder is created
+            await asyncio.gather(
+                asyncio.to_thread(os.makedirs, self.folder, exist_ok=True),
+                self.downloadable.size(),
+            )
 
     async def download(self):
-        if self.config.session.cli.dry_run:
+        cli = self.config.session.cli
+        if cli.dry_run:
             await self._print_dry_run_info()
             return
 
+        downloads = _track_downloads.setdefault(asyncio.get_running_loop(), {})
+        key = (self.downloadable.source, self.meta.info.id)
+        shared = downloads.get(key)
+        if shared is not None:
+            # Another album is downloading this track, and copies it here
+            # before its download finishes
+            task, copies = shared
+            copies.append(self.download_path)
+            await asyncio.shield(task)
+            return
+
+        copies: list[str] = []
+        task = asyncio.ensure_future(self._download_shared(downloads, key, copies))
+        downloads[key] = (task, copies)
+        await asyncio.shield(task)
+
+    async def _download_shared(self, downloads: dict, key: tuple, copies: list[str]):
+        """Download the track and copy it to the paths of albums sharing it."""
+        try:
+            downloaded = await self._download_file()
+        finally:
+            # Tracks arriving from here on download the file themselves
+            del downloads[key]
+        if not downloaded:
+            return
+        for path in copies:
+            if path == self.download_path:
+                continue
+            try:
+                await asyncio.to_thread(shutil.copyfile, self.download_path, path)
+            except OSError as e:
+                logger.error(f"Error copying track '{self.meta.title}' to {path}: {e}")
+
+    async def _download_file(self) -> bool:
+        """Download the track to `download_path`. Returns whether it succeeded."""
+        cli = self.config.session.cli
         # TODO: progress bar description
         # Note: Concurrency now managed by worker pool, no semaphore needed
-        with get_progress_callback(
-            self.config.session.cli.progress_bars,
-            await self.downloadable.size(),
-            f"Track {self.meta.tracknumber}",
-        ) as callback:
-            try:
-                await self.downloadable.download(self.download_path, callback)
-                retry = False
-            except Exception as e:
-                    logger.error(
-                        f"Error downloading track '{self.meta.title}', retrying: {e}"
-                    )
-                    retry = True
-
-            if not retry:
-                return
-
-            with get_progress_callback(
-                self.config.session.cli.progress_bars,
-                await self.downloadable.size(),
-                f"Track {self.meta.tracknumber} (retry)",
-            ) as callback:
+        size = await self.downloadable.size()
+        for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
+            desc = f"Track {self.meta.tracknumber}"
+            if attempt > 1:
+                desc += " (retry)"
+            with get_progress_callback(cli.progress_bars, size, desc) as callback:
                 try:
                     await self.downloadable.download(self.download_path, callback)
+                    return True
                 except Exception as e:
-                    logger.error(
-                        f"Persistent error downloading track '{self.meta.title}', skipping: {e}"
-                    )
-                    self.db.set_failed(
-                        self.downloadable.source, "track", self.meta.info.id
-                    )
+                    if attempt == DOWNLOAD_ATTEMPTS:
+                        logger.error(
+                            f"Persistent error downloading track '{self.meta.title}', skipping: {e}"
+                        )
+                    else:
+                        logger.error(
+                            f"Error downloading track '{self.meta.title}', retrying: {e}"
+                        )
+            if attempt < DOWNLOAD_ATTEMPTS:
+                await asyncio.sleep(DOWNLOAD_RETRY_BACKOFF * 2 ** (attempt - 1))
+
+        self.db.set_failed(self.downloadable.source, "track", self.meta.info.id)
+        return False
 
     async def _print_dry_run_info(self):
         """Print track information for dry run mode."""
         try:
             size_mb = (await self.downloadable.size()) / (1024 * 1024)
             size_str = f"{size_mb:.1f} MB"
-        except:
+        except (OSError, ValueError, asyncio.TimeoutError, NonStreamableError, aiohttp.ClientError):
             size_str = "Unknown size"
 
-        quality_info = f"Quality: {self.meta.info.quality}"
-        if hasattr(self.meta.info, 'bit_depth') and hasattr(self.meta.info, 'sampling_rate'):
-            if self.meta.info.bit_depth and self.meta.info.sampling_rate:
-                quality_info += f" ({self.meta.info.bit_depth}-bit/{self.meta.info.sampling_rate//1000}kHz)"
-
-        console.print(f"[cyan]Would download:[/cyan] [bold]{self.meta.title}[/bold]")
-        console.print(f"  Artist: {self.meta.artist}")
-        console.print(f"  Album: {self.meta.album.album}")
-        console.print(f"  Track: {self.meta.tracknumber}/{self.meta.album.tracktotal}")
+        info = self.meta.info
+        quality_info = f"Quality: {info.quality}"
+        if info.bit_depth and info.sampling_rate:
+            quality_info += f" ({info.bit_depth}-bit/{info.sampling_rate//1000}kHz)"
+
+        lines = [
+            f"[cyan]Would download:[/cyan] [bold]{self.meta.title}[/bold]",
+            f"  Artist: {self.meta.artist}",
+            f"  Album: {self.meta.album.album}",
+            f"  Track: {self.meta.tracknumber}/{self.meta.album.tracktotal}",
+        ]
         if self.meta.album.disctotal > 1:
-            console.print(f"  Disc: {self.meta.discnumber}/{self.meta.album.disctotal}")
-        console.print(f"  Source: {self.downloadable.source}")
-        console.print(f"  {quality_info}")
-        console.print(f"  Format: {self.meta.info.container}")
-        console.print(f"  Size: {size_str}")
-        console.print(f"  Path: [dim]{self.download_path}[/dim]")
-        console.print("")
+            lines.append(f"  Disc: {self.meta.discnumber}/{self.meta.album.disctotal}")
+        lines += [
+            f"  Source: {self.downloadable.source}",
+            f"  {quality_info}",
+            f"  Format: {info.container}",
+            f"  Size: {size_str}",
+            f"  Path: [dim]{self.download_path}[/dim]",
+            "",
+        ]
+        # One print keeps a track's lines together when tracks run concurrently
+        console.print("\n".join(lines))
 
     async def postprocess(self):
         if self.is_single:
             remove_title(self.meta.title)
 
-        if self.config.session.cli.dry_run:
+        session = self.config.session
+        if session.cli.dry_run:
             return
 
         # Validate audio file if enabled
-        if self.config.session.downloads.validate_audio:
+        if session.downloads.validate_audio:
             await self._validate_audio_file()
 
-        await tag_file(self.download_path, self.meta, self.cover_path)
-        if self.config.session.conversion.enabled:
+        conversion = session.conversion
+        if not conversion.enabled:
+            await tag_file(self.download_path, self.meta, self.cover_path)
+        elif converter.get(conversion.codec).container in TAGGABLE_EXTENSIONS:
+            # FFmpeg rewrites the whole file, so tag the converted file instead
+            # of tagging the source and relying on FFmpeg to carry tags over
+            await self._convert()
+            await tag_file(self.download_path, self.meta, self.cover_path)
+        else:
+            # Containers we can't tag (ogg, opus) get the source's tags from FFmpeg
+            await tag_file(self.download_path, self.meta, self.cover_path)
             await self._convert()
 
+        # Only marked once tagged, so a track that fails to tag is retried
         self.db.set_downloaded(self.meta.info.id)
 
     async def _validate_audio_file(self):
         """Validate the downloaded audio file for corruption."""
-        if not os.path.exists(self.download_path):
-            raise Exception(f"Audio file not found for validation: {self.download_path}")
+        path = self.download_path
+        if not await asyncio.to_thread(os.path.exists, path):
+            raise Exception(f"Audio file not found for validation: {path}")
 
-        logger.debug(f"Validating audio file: {self.download_path}")
-        validation_result = await validate_audio_file(self.download_path)
+        logger.debug(f"Validating audio file: {path}")
+        validation_result = await validate_audio_file(path)
 
         if not validation_result.is_valid:
             error_msg = f"Audio validation failed for '{self.meta.title}' by {self.meta.artist}"
@@ -141,10 +226,10 @@ class Track(Media):
             # Delete invalid file if configured
             if self.config.session.downloads.delete_invalid_files:
                 try:
-                    os.remove(self.download_path)
-                    logger.debug(f"Deleted invalid audio file: {self.download_path}")
+                    if await asyncio.to_thread(_delete_if_exists, path):
+                        logger.debug(f"Deleted invalid audio file: {path}")
                 except OSError as e:
-                    logger.warning(f"Failed to delete invalid file {self.download_path}: {e}")
+                    logger.warning(f"Failed to delete invalid file {path}: {e}")
 
             # Raise exception - let queue workers handle retry
             raise Exception(f"Audio validation failed: {validation_result.error_message}")
@@ -201,12 +286,10 @@ class PendingTrack(Pending):
         source = self.client.source
         try:
             resp = await self.client.get_metadata(self.id, "track")
+            meta = TrackMetadata.from_resp(self.album, source, resp)
         except NonStreamableError as e:
             logger.error(f"Track {self.id} not available for stream on {source}: {e}")
             return None
-
-        try:
-            meta = TrackMetadata.from_resp(self.album, source, resp)
         except Exception as e:
             logger.error(f"Error building track metadata for {self.id}: {e}")
             return None
@@ -218,7 +301,8 @@ class PendingTrack(Pending):
             return None
 
         # Check quality requirements and select appropriate quality
-        source_config = self.config.session.get_source(source)
+        session = self.config.session
+        source_config = session.get_source(source)
         requested_quality = source_config.quality
         lower_quality_fallback = getattr(source_config, 'lower_quality_if_not_available', False)
         
@@ -246,8 +330,7 @@ class PendingTrack(Pending):
         # Update container format based on actual downloadable format
         meta.info.container = downloadable.extension.upper()
 
-        downloads_config = self.config.session.downloads
-        if downloads_config.disc_subdirectories and self.album.disctotal > 1:
+        if session.downloads.disc_subdirectories and self.album.disctotal > 1:
             folder = os.path.join(self.folder, f"Disc {meta.discnumber}")
         else:
             folder = self.folder
@@ -314,7 +397,8 @@ class PendingSingle(Pending):
             return None
 
         # Check quality requirements and select appropriate quality
-        source_config = self.config.session.get_source(self.client.source)
+        config = self.config.session
+        source_config = config.get_source(self.client.source)
         requested_quality = source_config.quality
         lower_quality_fallback = getattr(source_config, 'lower_quality_if_not_available', False)
         
@@ -328,17 +412,16 @@ class PendingSingle(Pending):
         # Select the quality to download: min of requested and available
         quality = min(requested_quality, meta.info.quality)
         
-        config = self.config.session
         parent = config.downloads.folder
         if config.filepaths.add_singles_to_folder:
             folder = self._format_folder(album)
         else:
             folder = parent
 
-        os.makedirs(folder, exist_ok=True)
+        await asyncio.to_thread(os.makedirs, folder, exist_ok=True)
 
         embedded_cover_path, downloadable = await asyncio.gather(
-            self._download_cover(album.covers, folder),
+            self._download_cover(album, folder),
             self.client.get_downloadable(self.id, quality),
         )
         
@@ -364,12 +447,30 @@ class PendingSingle(Pending):
 
         return os.path.join(parent, meta.format_folder_path(formatter))
 
-    async def _download_cover(self, covers: Covers, folder: str) -> str | None:
-        embed_path, _ = await download_artwork(
-            self.client.session,
-            folder,
-            covers,
-            self.config.session.artwork,
-            for_playlist=False,
-        )
+    async def _download_cover(self, album: AlbumMetadata, folder: str) -> str | None:
+        tasks = _cover_tasks.setdefault(asyncio.get_running_loop(), OrderedDict())
+        key = (self.client.source, album.info.id, folder)
+        task = tasks.get(key)
+        if task is not None:
+            tasks.move_to_end(key)
+        else:
+            task = asyncio.ensure_future(
+                download_artwork(
+                    self.client.session,
+                    folder,
+                    album.covers,
+                    self.config.session.artwork,
+                    for_playlist=False,
+                )
+            )
+            tasks[key] = task
+
+            def _drop_if_failed(task: asyncio.Future):
+                if (task.cancelled() or task.exception() is not None) and tasks.get(key) is task:
+                    del tasks[key]
+
+            task.add_done_callback(_drop_if_failed)
+            if len(tasks) > COVER_CACHE_SIZE:
+                tasks.popitem(last=False)
+        embed_path, _ = await asyncio.shield(task)
         return embed_path
@@ -1,6 +1,8 @@
 import asyncio
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import AsyncGenerator
 
 from ..client import Client
 from ..config import Config
@@ -14,6 +16,44 @@ from .track import PendingSingle
 
 logger = logging.getLogger("streamrip")
 
+# Number of favorited items resolved and downloaded at once when
+# `max_connections` doesn't set a limit
+FAVORITES_CONCURRENCY = 5
+# Number of extra items resolved ahead while every download slot is busy, so
+# their metadata is ready when a slot frees up
+FAVORITES_PREFETCH = 2
+
+# Album ids of liked tracks, keyed by (source, track id), so that favorites
+# expanded to full albums again don't refetch every track's metadata. A track's
+# album doesn't change, so entries only leave the cache when it is full.
+TRACK_ALBUM_CACHE_SIZE = 16384
+_track_album_ids: OrderedDict[tuple[str, str], str] = OrderedDict()
+
+PENDING_BY_MEDIA_TYPE: dict[str, type[Pending]] = {
+    "tracks": PendingSingle,
+    "albums": PendingAlbum,
+    "artists": PendingArtist,
+    "playlists": PendingPlaylist,
+}
+
+
+async def _track_album_id(client: Client, track_id: str) -> str | None:
+    """Return the id of the album `track_id` belongs to, or None if unknown."""
+    key = (client.source, track_id)
+    album_id = _track_album_ids.get(key)
+    if album_id is not None:
+        _track_album_ids.move_to_end(key)
+        return album_id
+
+    resp = await client.get_metadata(track_id, "track")
+    album_id = (resp.get("album") or {}).get("id")
+    if album_id is None:
+        return None
+    album_id = _track_album_ids[key] = str(album_id)
+    if len(_track_album_ids) > TRACK_ALBUM_CACHE_SIZE:
+        _track_album_ids.popitem(last=False)
+    return album_id
+
 
 @dataclass(slots=True)
 class PendingUserFavorites(Pending):
@@ -25,10 +65,11 @@ class PendingUserFavorites(Pending):
 
     async def resolve(self) -> Media | None:
         """Resolve user favorites to a collection of media items."""
+        items = self.client.iter_user_favorites(self.media_type, user_id=self.user_id)
         try:
-            # Get favorites data from client API - all clients now have standardized interface
-            resp = await self.client.get_user_favorites(self.media_type, user_id=self.user_id)
-
+            # Wait for the first item only, so downloads can start while the
+            # remaining pages are still being fetched
+            first = await anext(items, None)
         except NonStreamableError as e:
             logger.error(f"User favorites {self.user_id}/{self.media_type} not available: {e}")
             return None
@@ -36,18 +77,23 @@ class PendingUserFavorites(Pending):
             logger.error(f"Error fetching user favorites: {e}")
             return None
 
-        # All clients now return standardized format: {"items": [...]}
-        if "items" not in resp or not resp["items"]:
+        if first is None:
             logger.info(f"No {self.media_type} found in user {self.user_id} favorites")
             return None
-        items = resp["items"]
-        logger.info(f"Found {len(items)} favorited {self.media_type} for user {self.user_id}")
+
+        async def _items():
+            try:
+                yield first
+                async for item in items:
+                    yield item
+            finally:
+                await items.aclose()
 
         # Create a UserFavorites collection
         return UserFavorites(
             user_id=self.user_id,
             media_type=self.media_type,
-            items=items,
+            items=_items(),
             client=self.client,
             config=self.config,
             db=self.db,
@@ -56,73 +102,105 @@ class PendingUserFavorites(Pending):
 
 @dataclass(slots=True)
 class UserFavorites(Media):
-    """Collection of user favorited items that downloads each item individually."""
+    """Collection of user favorited items that downloads each item individually.
+
+    `items` is consumed as it is fetched, so it can only be downloaded once.
+    """
     user_id: str
     media_type: str
-    items: list[dict]
+    items: AsyncGenerator[dict, None]
     client: Client
     config: Config
     db: Database
 
     async def preprocess(self):
         """No special preprocessing needed for user favorites."""
-        logger.info(f"Starting download of {len(self.items)} favorited {self.media_type} for user {self.user_id}")
+        logger.info(f"Starting download of favorited {self.media_type} for user {self.user_id}")
 
     async def download(self):
         """Download all items in the user's favorites."""
-        # If downloading full albums for liked tracks, get unique album IDs first
-        if (self.media_type == "tracks" and 
-            self.config.session.downloads.download_full_album_for_liked_tracks):
-            
-            # Get all track metadata in parallel to extract album IDs
-            track_ids = [str(item.get("id")) for item in self.items if item.get("id")]
-            metadata_results = await asyncio.gather(
-                *[self.client.get_metadata(tid, "track") for tid in track_ids], 
-                return_exceptions=True
-            )
-            
-            # Extract unique album IDs
-            album_ids = set()
-            for result in metadata_results:
-                if not isinstance(result, Exception):
-                    album_id = result.get("album", {}).get("id")
-                    if album_id:
-                        album_ids.add(str(album_id))
-            
-            logger.info(f"Found {len(album_ids)} unique albums from {len(track_ids)} liked tracks")
-            pending_items = [PendingAlbum(aid, self.client, self.config, self.db) for aid in album_ids]
-        else:
-            # Create Pending objects for each item directly
-            pending_items = []
-            for item in self.items:
-                item_id = str(item.get("id", "unknown"))
-                if item_id == "unknown":
+        # If downloading full albums for liked tracks, each track is expanded
+        # to its album and every album is downloaded once
+        downloads = self.config.session.downloads
+        full_albums = (
+            self.media_type == "tracks"
+            and downloads.download_full_album_for_liked_tracks
+        )
+        pending_class = PENDING_BY_MEDIA_TYPE.get(self.media_type)
+        if pending_class is None:
+            logger.error(f"Unsupported favorites media type: {self.media_type}")
+            return
+        album_ids: set[str] = set()
+        limit = downloads.max_connections
+        if limit <= 0:
+            limit = FAVORITES_CONCURRENCY
+        semaphore = asyncio.Semaphore(limit + FAVORITES_PREFETCH)
+        rip_semaphore = asyncio.Semaphore(limit)
+        tasks: set[asyncio.Task] = set()
+
+        async def _pending(item_id: str, item: dict) -> Pending | None:
+            if not full_albums:
+                return pending_class(item_id, self.client, self.config, self.db)
+            # Favorited tracks usually embed their album, so the track's
+            # metadata is only fetched when it doesn't
+            album_id = (item.get("album") or {}).get("id")
+            if album_id is not None:
+                album_id = str(album_id)
+            else:
+                album_id = await _track_album_id(self.client, item_id)
+            if album_id is None or album_id in album_ids:
+                return None
+            album_ids.add(album_id)
+            return PendingAlbum(album_id, self.client, self.config, self.db)
+
+        async def _process(item_id: str, item: dict):
+            try:
+                try:
+                    pending = await _pending(item_id, item)
+                    if pending is None:
+                        return
+                    media = await pending.resolve()
+                except Exception as e:
+                    logger.error(f"Error resolving item: {e}")
+                    return
+                if media is None:
+                    return
+                try:
+                    async with rip_semaphore:
+                        await media.rip()
+                except Exception as e:
+                    logger.error(f"Error downloading item: {e}")
+            finally:
+                semaphore.release()
+
+        # Each item is resolved and ripped as one task, started while later
+        # pages of favorites are still arriving. Acquiring before the task is
+        # created bounds the number of live tasks, and a new item starts as
+        # soon as any finishes. Only rips are limited to `limit`, so the
+        # FAVORITES_PREFETCH extra tasks resolve while the others download
+        count = 0
+        try:
+            async for item in self.items:
+                item_id = item.get("id")
+                if item_id is None:
                     continue
-                
-                if self.media_type == "tracks":
-                    pending_items.append(PendingSingle(item_id, self.client, self.config, self.db))
-                elif self.media_type == "albums":
-                    pending_items.append(PendingAlbum(item_id, self.client, self.config, self.db))
-                elif self.media_type == "artists":
-                    pending_items.append(PendingArtist(item_id, self.client, self.config, self.db))
-                elif self.media_type == "playlists":
-                    pending_items.append(PendingPlaylist(item_id, self.client, self.config, self.db))
-
-        # Process items in batches
-        batch_size = 5
-        for i in range(0, len(pending_items), batch_size):
-            batch = pending_items[i:i + batch_size]
-            results = await asyncio.gather(*[item.resolve() for item in batch], return_exceptions=True)
-            
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Error resolving item: {result}")
-                elif result is not None:
-                    try:
-                        await result.rip()
-                    except Exception as e:
-                        logger.error(f"Error downloading item: {e}")
+                count += 1
+                await semaphore.acquire()
+                task = asyncio.create_task(_process(str(item_id), item))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except Exception as e:
+            logger.error(f"Error fetching user favorites: {e}")
+        finally:
+            # Stop requesting pages that won't be consumed
+            await self.items.aclose()
+        await asyncio.gather(*tasks)
+
+        if full_albums:
+            logger.info(f"Found {len(album_ids)} unique albums from {count} liked tracks")
+        else:
+            logger.info(f"Found {count} favorited {self.media_type} for user {self.user_id}")
 
     async def postprocess(self):
         """No special postprocessing needed for user favorites."""
-        logger.info(f"Completed download of favorited {self.media_type} for user {self.user_id}")
\ No newline at end of file
+        logger.info(f"Completed download of favorited {self.media_type} for user {self.user_id}")
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import functools
 import logging
 import re
+import string
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 
@@ -15,7 +21,122 @@ COPYRIGHT = "\u00a9"
 logger = logging.getLogger("streamrip")
 
 
-genre_clean = re.compile(r"([^\u2192\/]+)")
+copyright_symbols = re.compile(r"\(([PpCc])\)")
+
+# Parsed album metadata of Qobuz and Deezer track responses, keyed by (source,
+# album id), so that tracks of the same album (e.g. in a playlist) don't parse
+# the same embedded album each. Callers get copies, see `AlbumMetadata.copy`.
+ALBUM_CACHE_SIZE = 4096
+_album_cache: OrderedDict[tuple[str, str], AlbumMetadata] = OrderedDict()
+
+# Qobuz release types that don't read well title cased
+QOBUZ_RELEASE_TYPES: dict[str, str] = {
+    "epmini": "EP",
+    "bestof": "Best Of",
+}
+# Streaming service release types mapped to RYM album types
+RYM_ALBUM_TYPES: dict[str, str] = {
+    "ep": "ep",
+    "single": "single",
+    "compilation": "compilation",
+    "best of": "compilation",
+    "album": "album",
+}
+# Tidal audioQuality -> (quality, sampling rate, bit depth, container).
+# AAC is used for lower qualities
+TIDAL_QUALITIES: dict[str, tuple[int, int | None, int | None, str]] = {
+    "LOW": (0, None, None, "MP4"),
+    "HIGH": (1, None, None, "MP4"),
+    "LOSSLESS": (2, 44100, 16, "FLAC"),
+    "HI_RES": (3, 44100, 24, "FLAC"),
+}
+
+
+def _copyright_symbol(match: re.Match) -> str:
+    return PHON_COPYRIGHT if match.group(1) in "Pp" else COPYRIGHT
+
+
+def _year_of(date: str | None, default: str) -> str:
+    """Return the year of a "YYYY-MM-DD" date, or `default` if there is no date."""
+    return date[:4] if date else default
+
+
+@functools.lru_cache(maxsize=64)
+def _map_rym_album_type(releasetype: str | None) -> str:
+    """Map a streaming service release type to a RYM album type."""
+    if not releasetype:
+        return "album"  # Default
+
+    return RYM_ALBUM_TYPES.get(releasetype.lower(), "album")
+
+
+def _label_from_copyright(_copyright: str | None) -> str | None:
+    """Extract the label from a copyright string: "(C) 2000 Label Name" -> "Label Name"."""
+    if not _copyright or _copyright[:3].upper() not in ("(C)", "(P)"):
+        return None
+    label = _copyright[3:].lstrip()
+    # Without a year (or with nothing after it), only the prefix is removed
+    if label[:4].isdecimal() and label[4:].strip():
+        label = label[4:]
+    return label.strip() or None
+
+
+@functools.lru_cache(maxsize=32)
+def _template_fields(formatter: str) -> frozenset[str]:
+    """Names of the fields referenced by a `str.format` template."""
+    return frozenset(
+        re.split(r"[.\[]", field, maxsplit=1)[0]
+        for _, field, _, _ in string.Formatter().parse(formatter)
+        if field
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_folder_path(
+    formatter: str,
+    albumartist: str,
+    albumcomposer: str | None,
+    bit_depth: int | None,
+    id: str,
+    sampling_rate: int | float | None,
+    album: str,
+    year: str,
+    container: str,
+    releasetype: str | None,
+) -> str:
+    """Format and sanitize an album folder name.
+
+    Memoized, since every album in a discography is formatted with the same
+    template and the sanitizing is comparatively expensive.
+    """
+    none_str = "Unknown"
+
+    def _releasetype():
+        # Format releasetype with title case, except keep EP uppercase
+        if not releasetype:
+            return none_str
+        rt = clean_filename(releasetype)
+        return "EP" if rt.upper() == "EP" else rt.title()
+
+    fields = {
+        "albumartist": lambda: clean_filename(albumartist),
+        "albumcomposer": lambda: (
+            (clean_filename(albumcomposer) or none_str) if albumcomposer else none_str
+        ),
+        "bit_depth": lambda: bit_depth or none_str,
+        "id": lambda: id,
+        "sampling_rate": lambda: sampling_rate or none_str,
+        "title": lambda: clean_filename(album),
+        "year": lambda: year,
+        "container": lambda: container,
+        "releasetype": _releasetype,
+    }
+    # Only the fields used by the template are sanitized
+    info: dict[str, str | int | float] = {
+        key: fields[key]() for key in _template_fields(formatter) if key in fields
+    }
+
+    return clean_filepath(formatter.format(**info))
 
 
 @dataclass(slots=True)
@@ -67,27 +188,18 @@ class AlbumMetadata:
     # RYM metadata
     rym_descriptors: list[str] | None = None  # RateYourMusic descriptors
 
+    def copy(self) -> AlbumMetadata:
+        """Return a copy whose mutable fields can be changed independently."""
+        return dataclasses.replace(
+            self,
+            info=dataclasses.replace(self.info),
+            genre=list(self.genre),
+            covers=self.covers.copy(),
+        )
+
     def get_genres(self) -> str:
         return ", ".join(self.genre)
 
-    def _get_rym_album_type(self) -> str:
-        """Map streaming metadata to RYM album type."""
-        if not self.releasetype:
-            return "album"  # Default
-
-        release_type = self.releasetype.lower()
-
-        # Map streaming service types to RYM types
-        type_mapping = {
-            "ep": "ep",
-            "single": "single",
-            "compilation": "compilation",
-            "best of": "compilation",
-            "album": "album"
-        }
-
-        return type_mapping.get(release_type, "album")
-
     async def enrich_with_rym(self, rym_service):
         """Enrich this album metadata with RateYourMusic data using comprehensive fallback strategy.
 
@@ -114,7 +226,7 @@ class AlbumMetadata:
                     year = None
 
             # Determine album type from streaming metadata
-            album_type = self._get_rym_album_type()
+            album_type = _map_rym_album_type(self.releasetype)
 
             # Single call with comprehensive fallback built-in
             # (album search with optimized flow → artist fallback if needed)
@@ -148,50 +260,64 @@ class AlbumMetadata:
             self.rym_descriptors = []
             logger.debug(f"Failed to enrich {self.albumartist} - {self.album} with RYM data: {e}")
 
+    @classmethod
+    async def enrich_many_with_rym(
+        cls, albums: list[AlbumMetadata], rym_service, max_concurrency: int = 8
+    ):
+        """Enrich several albums with RateYourMusic data concurrently.
+
+        At most `max_concurrency` lookups are in flight at once.
+        """
+        if not rym_service:
+            return
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _enrich(album: AlbumMetadata):
+            async with semaphore:
+                await album.enrich_with_rym(rym_service)
+
+        await asyncio.gather(*(_enrich(album) for album in albums))
+
     def get_copyright(self) -> str | None:
         if self.copyright is None:
             return None
         # Add special chars
-        _copyright = re.sub(r"(?i)\(P\)", PHON_COPYRIGHT, self.copyright)
-        _copyright = re.sub(r"(?i)\(C\)", COPYRIGHT, _copyright)
-        return _copyright
+        return copyright_symbols.sub(_copyright_symbol, self.copyright)
 
     def format_folder_path(self, formatter: str) -> str:
         # Available keys: "albumartist", "title", "year", "bit_depth", "sampling_rate",
         # "id", "albumcomposer", "releasetype"
-
-        none_str = "Unknown"
-        # Format releasetype with title case, except keep EP uppercase
-        releasetype_formatted = none_str
-        if self.releasetype:
-            rt = clean_filename(self.releasetype)
-            if rt.upper() == "EP":
-                releasetype_formatted = "EP"
-            else:
-                releasetype_formatted = rt.title()
-        
-        info: dict[str, str | int | float] = {
-            "albumartist": clean_filename(self.albumartist),
-            "albumcomposer": clean_filename(self.albumcomposer or "") or none_str,
-            "bit_depth": self.info.bit_depth or none_str,
-            "id": self.info.id,
-            "sampling_rate": self.info.sampling_rate or none_str,
-            "title": clean_filename(self.album),
-            "year": self.year,
-            "container": self.info.container,
-            "releasetype": releasetype_formatted,
-        }
-
-        return clean_filepath(formatter.format(**info))
+        return _format_folder_path(
+            formatter,
+            self.albumartist,
+            self.albumcomposer,
+            self.info.bit_depth,
+            self.info.id,
+            self.info.sampling_rate,
+            self.album,
+            self.year,
+            self.info.container,
+            self.releasetype,
+        )
 
     @classmethod
     def from_qobuz(cls, resp: dict) -> AlbumMetadata:
         album = resp.get("title", "Unknown Album")
         tracktotal = resp.get("tracks_count", 1)
         genre = resp.get("genres_list") or resp.get("genre") or []
-        genres = list(set(genre_clean.findall("/".join(genre))))
+        # Qobuz genre paths look like "Pop/Rock\u2192Rock"
+        genres = list(
+            dict.fromkeys(
+                name
+                for path in genre
+                for part in path.split("/")
+                for name in part.split("\u2192")
+                if name
+            )
+        )
         date = resp.get("release_date_original") or resp.get("release_date")
-        year = date[:4] if date is not None else "Unknown"
+        year = _year_of(date, "Unknown")
 
         _copyright = resp.get("copyright", "")
 
@@ -207,14 +333,8 @@ class AlbumMetadata:
             _label = _label["name"]
         label = typed(_label or "", str)
         description = typed(resp.get("description", ""), str)
-        disctotal = typed(
-            max(
-                track.get("media_number", 1)
-                for track in safe_get(resp, "tracks", default=[{}])  # type: ignore
-            )
-            or 1,
-            int,
-        )
+        tracks = resp.get("tracks") or ()
+        disctotal = int(max((track.get("media_number", 1) for track in tracks), default=1) or 1)
         explicit = typed(resp.get("parental_warning", False), bool)
 
         # Non-embedded information
@@ -231,11 +351,10 @@ class AlbumMetadata:
         barcode = resp.get("upc")
         # Normalize release type casing: keep EP uppercase, others title case
         raw_type = resp.get("release_type")
-        type_mapper = {
-            "epmini": "EP",
-            "bestof": "Best Of",
-        }
-        releasetype = type_mapper.get(raw_type.lower(), str(raw_type).title())
+        if raw_type:
+            releasetype = QOBUZ_RELEASE_TYPES.get(raw_type.lower(), raw_type.title())
+        else:
+            releasetype = None
         originaldate = resp.get("release_date_original")
         media_type = "Digital Media"  # MusicBrainz standard for digital/streaming sources
         
@@ -273,16 +392,10 @@ class AlbumMetadata:
             genre=genres,
             covers=cover_urls,
             albumcomposer=albumcomposer,
-            comment=None,
-            compilation=None,
             copyright=_copyright,
             date=date,
             description=description,
             disctotal=disctotal,
-            encoder=None,
-            grouping=None,
-            lyrics=None,
-            purchase_date=None,
             tracktotal=tracktotal,
             source_platform=source_platform,
             source_album_id=source_album_id,
@@ -353,16 +466,10 @@ class AlbumMetadata:
             genre=genres,
             covers=cover_urls,
             albumcomposer=albumcomposer,
-            comment=None,
-            compilation=None,
             copyright=_copyright,
             date=date,
             description=description,
             disctotal=disctotal,
-            encoder=None,
-            grouping=None,
-            lyrics=None,
-            purchase_date=None,
             tracktotal=tracktotal,
             source_platform="deezer",
             source_album_id=item_id,
@@ -424,17 +531,10 @@ class AlbumMetadata:
             year,
             genre=genres,
             covers=covers,
-            albumcomposer=None,
-            comment=None,
-            compilation=None,
             copyright=copyright,
             date=date,
             description=description,
             disctotal=disctotal,
-            encoder=None,
-            grouping=None,
-            lyrics=None,
-            purchase_date=None,
             tracktotal=tracktotal,
         )
 
@@ -446,139 +546,57 @@ class AlbumMetadata:
             resp: API response containing album metadata.
         Returns: AlbumMetadata instance with streamable attribute set.
         """
-        streamable = resp.get("allowStreaming", True)
-
-        item_id = str(resp["id"])
-        album = typed(resp.get("title", "Unknown Album"), str)
-        tracktotal = typed(resp.get("numberOfTracks", 1), int)
         # genre not returned by API
         date = typed(resp.get("releaseDate"), str)
-        year = date[:4]
-        _copyright = typed(resp.get("copyright", ""), str)
-
-        artists = typed(resp.get("artists", []), list)
-        artist_id = None
-        if artists:
-            # Get first artist as primary albumartist (MusicBrainz standard)
-            albumartist = artists[0]["name"]
-            # Get first artist ID for source_artist_id
-            artist_id = str(artists[0]["id"])
-        else:
-            albumartist = typed(safe_get(resp, "artist", "name", default=""), str)
-            if "artist" in resp and "id" in resp["artist"]:
-                artist_id = str(resp["artist"]["id"])
-
-        disctotal = typed(resp.get("numberOfVolumes", 1), int)
-        
-        # Extract label from copyright field since Tidal doesn't provide direct label field
-        label = None
-        if _copyright:
-            # Parse copyright to extract label: "(C) 2000 Label Name" -> "Label Name"
-            import re
-            copyright_match = re.match(r'^\([CP]\)\s*\d{4}\s*(.+)$', _copyright, re.IGNORECASE)
-            if copyright_match:
-                label = copyright_match.group(1).strip()
-            else:
-                # Fallback: if no year pattern, just remove (C) or (P) prefix
-                label_match = re.match(r'^\([CP]\)\s*(.+)$', _copyright, re.IGNORECASE)
-                if label_match:
-                    label = label_match.group(1).strip()
-        
-        # Extract additional Tidal metadata
-        barcode = resp.get("upc")  # UPC/Barcode
-        # Normalize release type casing: keep EP uppercase, others title case
-        raw_type = resp.get("type")
-        if raw_type:
-            if raw_type.upper() == "EP":
-                releasetype = "EP"
-            else:
-                releasetype = raw_type.title()  # Album, Single, etc.
-        else:
-            releasetype = None
-        media_type = "Digital Media"  # MusicBrainz standard for digital/streaming sources
-
-        # non-embedded
-        explicit = typed(resp.get("explicit", False), bool)
-        covers = Covers.from_tidal(resp)
-        if covers is None:
-            covers = Covers()
-
-        quality_map: dict[str, int] = {
-            "LOW": 0,
-            "HIGH": 1,
-            "LOSSLESS": 2,
-            "HI_RES": 3,
-        }
-
-        tidal_quality = resp.get("audioQuality", "LOW")
-        quality = quality_map[tidal_quality]
-        if quality >= 2:
-            sampling_rate = 44100
-            if quality == 3:
-                bit_depth = 24
-                container = "FLAC"
-            else:
-                bit_depth = 16
-                container = "FLAC"
-        else:
-            sampling_rate = None
-            bit_depth = None
-            container = "MP4"  # AAC for lower qualities
-
-        info = AlbumInfo(
-            id=item_id,
-            quality=quality,
-            container=container,
-            label=label,
-            explicit=explicit,
-            sampling_rate=sampling_rate,
-            bit_depth=bit_depth,
-            booklets=None,
-            streamable=streamable,
-        )
-        return AlbumMetadata(
-            info,
-            album,
-            albumartist,
-            year,
-            genre=[],
-            covers=covers,
-            albumcomposer=None,
-            comment=None,
-            compilation=None,
-            copyright=_copyright,
+        return cls._from_tidal_resp(
+            resp,
+            album=typed(resp.get("title", "Unknown Album"), str),
+            tracktotal=typed(resp.get("numberOfTracks", 1), int),
+            disctotal=typed(resp.get("numberOfVolumes", 1), int),
             date=date,
-            description=None,
-            disctotal=disctotal,
-            encoder=None,
-            grouping=None,
-            lyrics=None,
-            purchase_date=None,
-            tracktotal=tracktotal,
-            source_platform="tidal",
-            source_album_id=item_id,
-            source_artist_id=artist_id,
-            barcode=barcode,
-            releasetype=releasetype,
-            media_type=media_type,
+            year=date[:4],
+            covers=Covers.from_tidal(resp),
+            source_album_id=str(resp["id"]),
+            default_albumartist="",
+            barcode=resp.get("upc"),  # UPC/Barcode
         )
 
     @classmethod
     def from_tidal_playlist_track_resp(cls, resp: dict) -> AlbumMetadata:
         album_resp = resp["album"]
-        streamable = resp.get("allowStreaming", True)
-
-        item_id = str(resp["id"])
-        album = typed(album_resp.get("title", "Unknown Album"), str)
-        tracktotal = 1
-        # genre not returned by API
         date = typed(resp.get("streamStartDate"), str | None)
-        if date is not None:
-            year = date[:4]
-        else:
-            year = "Unknown Year"
+        return cls._from_tidal_resp(
+            resp,
+            album=typed(album_resp.get("title", "Unknown Album"), str),
+            tracktotal=1,
+            disctotal=typed(resp.get("volumeNumber", 1), int),
+            date=date,
+            year=_year_of(date, "Unknown Year"),
+            covers=Covers.from_tidal(album_resp),
+            source_album_id=str(album_resp["id"]),
+            default_albumartist="Unknown Albumbartist",
+            barcode=None,
+        )
 
+    @classmethod
+    def _from_tidal_resp(
+        cls,
+        resp: dict,
+        album: str,
+        tracktotal: int,
+        disctotal: int,
+        date: str | None,
+        year: str,
+        covers: Covers | None,
+        source_album_id: str,
+        default_albumartist: str,
+        barcode: str | None,
+    ) -> AlbumMetadata:
+        """Build the metadata shared by Tidal album and playlist track responses."""
+        streamable = resp.get("allowStreaming", True)
+        item_id = str(resp["id"])
         _copyright = typed(resp.get("copyright", ""), str)
+
         artists = typed(resp.get("artists", []), list)
         artist_id = None
         if artists:
@@ -588,28 +606,14 @@ class AlbumMetadata:
             artist_id = str(artists[0]["id"])
         else:
             albumartist = typed(
-                safe_get(resp, "artist", "name", default="Unknown Albumbartist"), str
+                safe_get(resp, "artist", "name", default=default_albumartist), str
             )
             if "artist" in resp and "id" in resp["artist"]:
                 artist_id = str(resp["artist"]["id"])
 
-        disctotal = typed(resp.get("volumeNumber", 1), int)
-        
         # Extract label from copyright field since Tidal doesn't provide direct label field
-        label = None
-        if _copyright:
-            # Parse copyright to extract label: "(C) 2000 Label Name" -> "Label Name"
-            import re
-            copyright_match = re.match(r'^\([CP]\)\s*\d{4}\s*(.+)$', _copyright, re.IGNORECASE)
-            if copyright_match:
-                label = copyright_match.group(1).strip()
-            else:
-                # Fallback: if no year pattern, just remove (C) or (P) prefix
-                label_match = re.match(r'^\([CP]\)\s*(.+)$', _copyright, re.IGNORECASE)
-                if label_match:
-                    label = label_match.group(1).strip()
-        
-        # Extract additional Tidal metadata
+        label = _label_from_copyright(_copyright)
+
         # Normalize release type casing: keep EP uppercase, others title case
         raw_type = resp.get("type")
         if raw_type:
@@ -623,31 +627,12 @@ class AlbumMetadata:
 
         # non-embedded
         explicit = typed(resp.get("explicit", False), bool)
-        covers = Covers.from_tidal(album_resp)
         if covers is None:
             covers = Covers()
 
-        quality_map: dict[str, int] = {
-            "LOW": 0,
-            "HIGH": 1,
-            "LOSSLESS": 2,
-            "HI_RES": 3,
-        }
-
-        tidal_quality = resp.get("audioQuality", "LOW")
-        quality = quality_map[tidal_quality]
-        if quality >= 2:
-            sampling_rate = 44100
-            if quality == 3:
-                bit_depth = 24
-                container = "FLAC"
-            else:
-                bit_depth = 16
-                container = "FLAC"
-        else:
-            sampling_rate = None
-            bit_depth = None
-            container = "MP4"  # AAC for lower qualities
+        quality, sampling_rate, bit_depth, container = TIDAL_QUALITIES[
+            resp.get("audioQuality", "LOW")
+        ]
 
         info = AlbumInfo(
             id=item_id,
@@ -667,21 +652,14 @@ class AlbumMetadata:
             year,
             genre=[],
             covers=covers,
-            albumcomposer=None,
-            comment=None,
-            compilation=None,
             copyright=_copyright,
             date=date,
-            description=None,
             disctotal=disctotal,
-            encoder=None,
-            grouping=None,
-            lyrics=None,
-            purchase_date=None,
             tracktotal=tracktotal,
             source_platform="tidal",
-            source_album_id=str(album_resp["id"]),
+            source_album_id=source_album_id,
             source_artist_id=artist_id,
+            barcode=barcode,
             releasetype=releasetype,
             media_type=media_type,
         )
@@ -715,42 +693,55 @@ class AlbumMetadata:
             year,
             genre=[],
             covers=covers,
-            albumcomposer=None,
-            comment=None,
-            compilation=None,
-            copyright=None,
             date=date,
-            description=None,
             disctotal=1,
-            encoder=None,
-            grouping=None,
-            lyrics=None,
-            purchase_date=None,
             tracktotal=1,
         )
 
     @classmethod
     def from_track_resp(cls, resp: dict, source: str) -> AlbumMetadata:
-        if source == "qobuz":
-            return cls.from_qobuz(resp["album"])
-        if source == "tidal":
-            return cls.from_tidal_playlist_track_resp(resp)
-        if source == "soundcloud":
-            return cls.from_soundcloud(resp)
-        if source == "deezer":
-            if "tracks" not in resp["album"]:
-                return cls.from_incomplete_deezer_track_resp(resp)
-            return cls.from_deezer(resp["album"])
-        raise Exception("Invalid source")
+        parse = _TRACK_ALBUM_PARSERS.get(source)
+        if parse is not None:
+            return parse(resp)
+        if source == "deezer" and "tracks" not in resp["album"]:
+            return cls.from_incomplete_deezer_track_resp(resp)
+        if source not in _ALBUM_PARSERS:
+            raise Exception("Invalid source")
+
+        # Otherwise the album metadata only depends on the embedded album
+        key = (source, str(resp["album"]["id"]))
+        meta = _album_cache.get(key)
+        if meta is None:
+            meta = _ALBUM_PARSERS[source](resp["album"])
+            _album_cache[key] = meta
+            if len(_album_cache) > ALBUM_CACHE_SIZE:
+                _album_cache.popitem(last=False)
+        else:
+            _album_cache.move_to_end(key)
+        return meta.copy()
 
     @classmethod
     def from_album_resp(cls, resp: dict, source: str) -> AlbumMetadata:
-        if source == "qobuz":
-            return cls.from_qobuz(resp)
-        if source == "tidal":
-            return cls.from_tidal(resp)
-        if source == "soundcloud":
-            return cls.from_soundcloud(resp)
-        if source == "deezer":
-            return cls.from_deezer(resp)
-        raise Exception("Invalid source")
+        parse = _ALBUM_PARSERS.get(source)
+        if parse is None:
+            raise Exception("Invalid source")
+        meta = parse(resp)
+        # Discography filters compare this against the artist name for every
+        # album, interning lets equal names share one object
+        meta.albumartist = sys.intern(meta.albumartist)
+        return meta
+
+
+# Album response parser of each source
+_ALBUM_PARSERS = {
+    "qobuz": AlbumMetadata.from_qobuz,
+    "tidal": AlbumMetadata.from_tidal,
+    "soundcloud": AlbumMetadata.from_soundcloud,
+    "deezer": AlbumMetadata.from_deezer,
+}
+# Sources whose track responses carry album fields that vary per track, so
+# they are parsed from the whole track response and not cached
+_TRACK_ALBUM_PARSERS = {
+    "tidal": AlbumMetadata.from_tidal_playlist_track_resp,
+    "soundcloud": AlbumMetadata.from_soundcloud,
+}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass
 
 logger = logging.getLogger("streamrip")
@@ -17,11 +18,8 @@ class ArtistMetadata:
     @classmethod
     def from_resp(cls, resp: dict, source: str) -> ArtistMetadata:
         logger.debug(resp)
-        if source == "qobuz":
-            return cls(resp["name"], [a["id"] for a in resp["albums"]])
-        elif source == "tidal":
-            return cls(resp["name"], [a["id"] for a in resp["albums"]])
-        elif source == "deezer":
-            return cls(resp["name"], [a["id"] for a in resp["albums"]])
+        if source in ("qobuz", "tidal", "deezer"):
+            # Interned to match AlbumMetadata.albumartist in discography filters
+            return cls(sys.intern(resp["name"]), [a["id"] for a in resp["albums"]])
         else:
             raise NotImplementedError
@@ -15,6 +15,11 @@ class Covers:
             ("thumbnail", None, None),
         ]
 
+    def copy(self) -> "Covers":
+        covers = Covers.__new__(Covers)
+        covers._covers = self._covers.copy()
+        return covers
+
     def set_cover(self, size: str, url: str | None, path: str | None):
         i = self._indexof(size)
         self._covers[i] = (size, url, path)
@@ -18,6 +18,9 @@ logger = logging.getLogger("streamrip")
 
 FLAC_MAX_BLOCKSIZE = 16777215  # 16.7 MB
 
+# Extensions of the files `tag_file` can write tags to
+TAGGABLE_EXTENSIONS = frozenset({"flac", "m4a", "mp3"})
+
 MP4_KEYS = (
     "\xa9nam",
     "\xa9ART",
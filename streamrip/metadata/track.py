@@ -50,7 +50,7 @@ class TrackMetadata:
 
     @classmethod
     def from_qobuz(cls, album: AlbumMetadata, resp: dict) -> TrackMetadata:
-        title = typed(resp["title"].strip(), str)
+        title = resp["title"].strip()
         isrc = typed(resp["isrc"], str)
         streamable = typed(resp.get("streamable", False), bool)
 
@@ -157,9 +157,11 @@ class TrackMetadata:
         # resp.qualities is already an array: [MP3_128 or None, MP3_320 or None, FLAC or None]
         qualities = resp.get("qualities", [None, None, None])
         
-        # Find highest available quality (max index where quality is not None)
-        available_indices = [i for i, q in enumerate(qualities) if q is not None]
-        available_quality = max(available_indices) if available_indices else None
+        # Find highest available quality: scan from the top and stop at the first hit
+        available_quality = next(
+            (i for i in range(len(qualities) - 1, -1, -1) if qualities[i] is not None),
+            None,
+        )
         
         # Check if track is streamable based on readable field and available qualities
         streamable = resp.get("readable", True) and available_quality is not None
@@ -251,7 +253,7 @@ class TrackMetadata:
             bool,
         )
 
-        title = typed(track["title"].strip(), str)
+        title = track["title"].strip()
         artist = typed(track["user"]["username"], str)
         artists = [artist]  # Soundcloud has single artist
         tracknumber = 1
@@ -280,7 +282,7 @@ class TrackMetadata:
 
     @classmethod
     def from_tidal(cls, album: AlbumMetadata, track) -> TrackMetadata:
-        title = typed(track["title"], str).strip()
+        title = track["title"].strip()
         item_id = str(track["id"])
         isrc = typed(track["isrc"], str)
         version = track.get("version")
@@ -1,13 +1,11 @@
-import functools
 from typing import Optional, Type, TypeVar
 
 
 def safe_get(dictionary, *keys, default=None):
-    return functools.reduce(
-        lambda d, key: d.get(key, default) if isinstance(d, dict) else default,
-        keys,
-        dictionary,
-    )
+    d = dictionary
+    for key in keys:
+        d = d.get(key, default) if isinstance(d, dict) else default
+    return d
 
 
 T = TypeVar("T")
@@ -8,6 +8,7 @@ import aiofiles
 from .. import db
 from ..download_task import DownloadTask
 from ..client import Client, DeezerClient, QobuzClient, SoundcloudClient, TidalClient
+from ..client.client import close_shared_connectors
 from ..config import APP_DIR, Config
 from ..console import console
 from ..media import (
@@ -653,8 +654,8 @@ class Main:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         # Ensure all client sessions are closed
         for client in self.clients.values():
-            if hasattr(client, "session"):
-                await client.session.close()
+            await client.close()
+        await close_shared_connectors()
 
         # Cleanup RYM scraper browser session
         if self.rym_scraper:
@@ -4,11 +4,18 @@ import asyncio
 import logging
 import os
 import shutil
+import weakref
 from pathlib import Path
 from typing import NamedTuple, Optional
 
 logger = logging.getLogger("streamrip")
 
+# Validation decodes the whole file in a subprocess, so bound how many run
+# at once when many downloads finish together
+MAX_CONCURRENT_VALIDATIONS = os.cpu_count() or 1
+
+_validation_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
 
 class ValidationResult(NamedTuple):
     """Result of audio file validation."""
@@ -202,4 +209,10 @@ async def validate_audio_file(file_path: str) -> ValidationResult:
         ValidationResult with validation status and details
     """
     validator = get_audio_validator()
-    return await validator.validate_audio_file(file_path)
\ No newline at end of file
+    loop = asyncio.get_running_loop()
+    semaphore = _validation_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_VALIDATIONS)
+        _validation_semaphores[loop] = semaphore
+    async with semaphore:
+        return await validator.validate_audio_file(file_path)
\ No newline at end of file
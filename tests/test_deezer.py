@@ -113,6 +113,55 @@ def test_deezer_quality_mapping(mock_deezer_client):
         downloadable = arun(mock_deezer_client.get_downloadable("123", quality=0))
         assert downloadable.quality == 0
 
+def test_deezer_prefetch_tracks_skips_gw_get_track(mock_deezer_client):
+    """Unit test: prefetched gw info is used instead of a per-track gw.get_track call"""
+    mock_deezer_client.client.gw.get_tracks.return_value = [
+        {"SNG_ID": "1", "TRACK_TOKEN": "token1"},
+        {"SNG_ID": "2", "TRACK_TOKEN": "token2"},
+    ]
+    mock_deezer_client.client.get_track_url.return_value = "https://test.flac"
+
+    arun(mock_deezer_client.prefetch_tracks(["1", "2"]))
+    mock_deezer_client.client.gw.get_tracks.assert_called_once_with(["1", "2"])
+
+    downloadable = arun(mock_deezer_client.get_downloadable("2", quality=2))
+    assert downloadable.url == "https://test.flac"
+    mock_deezer_client.client.gw.get_track.assert_not_called()
+    mock_deezer_client.client.get_track_url.assert_called_once_with("token2", "FLAC")
+
+def test_deezer_get_track_caches_album_requests(mock_deezer_client):
+    """Unit test: tracks from the same album share the album API responses"""
+    api = mock_deezer_client.client.api = Mock()
+    api.get_track.side_effect = lambda id: {"id": id, "album": {"id": "10"}}
+    api.get_album.return_value = {"id": "10", "title": "Test Album"}
+    api.get_album_tracks.return_value = {"data": [{"id": "1"}, {"id": "2"}]}
+    mock_deezer_client.client.gw.get_track.return_value = {"FILESIZE_FLAC": "1"}
+
+    first = arun(mock_deezer_client.get_track("1"))
+    second = arun(mock_deezer_client.get_track("2"))
+
+    assert first["album"]["track_total"] == second["album"]["track_total"] == 2
+    api.get_album.assert_called_once_with("10")
+    api.get_album_tracks.assert_called_once_with("10")
+    assert "tracks" not in api.get_album.return_value
+
+def test_deezer_get_playlist_fetches_remaining_pages(mock_deezer_client):
+    """Unit test: a paginated tracklist is completed with concurrent page requests"""
+    api = mock_deezer_client.client.api = Mock()
+    api.get_playlist.return_value = {"id": "5", "title": "Test Playlist"}
+
+    def get_playlist_tracks(id, index=0, limit=-1):
+        page = limit if limit > 0 else 25
+        return {"data": [{"id": i} for i in range(index, min(index + page, 60))], "total": 60}
+
+    api.get_playlist_tracks.side_effect = get_playlist_tracks
+
+    playlist = arun(mock_deezer_client.get_playlist("5"))
+
+    assert [t["id"] for t in playlist["tracks"]] == list(range(60))
+    assert playlist["track_total"] == 60
+    assert api.get_playlist_tracks.call_count == 3
+
 # ===== INTEGRATION TEST =====
 
 @pytest.mark.skipif(
@@ -0,0 +1,23 @@
+import pytest
+from pathvalidate import sanitize_filename
+
+from streamrip.filepath_utils import clean_filename
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "Fleetwood Mac",
+        "Rumours (Super Deluxe)",
+        "AC/DC",
+        "What's Going On?",
+        "Con",
+        "COM1",
+        " Leading space",
+        "Trailing space ",
+        "Sigur Rós",
+        "a" * 300,
+    ],
+)
+def test_clean_filename_matches_pathvalidate(name):
+    assert clean_filename(name) == str(sanitize_filename(name))[:255]
@@ -1,6 +1,11 @@
+import asyncio
 import json
 
+import pytest
+from util import arun
+
 from streamrip.metadata import AlbumMetadata, TrackMetadata
+from streamrip.metadata.album import _label_from_copyright, _map_rym_album_type
 
 with open("tests/qobuz_album_resp.json") as f:
     qobuz_album_resp = json.load(f)
@@ -26,6 +31,8 @@ def test_album_metadata_qobuz():
     assert m.year == "1977"
     assert "Pop" in m.genre
     assert "Rock" in m.genre
+    # Deduplicated in the order the genres are listed
+    assert m.genre == ["Pop", "Rock"]
     assert not m.covers.empty()
 
     assert m.albumcomposer == "Various Composers"
@@ -61,3 +68,64 @@ def test_track_metadata_qobuz():
     assert t.tracknumber == 9
     assert t.discnumber == 1
     assert t.composer == "John Darnielle"
+
+
+def test_album_metadata_from_track_resp_returns_independent_copies():
+    first = AlbumMetadata.from_track_resp(qobuz_track_resp, "qobuz")
+    second = AlbumMetadata.from_track_resp(qobuz_track_resp, "qobuz")
+    assert first is not second
+    assert first.info == second.info
+    assert first.album == second.album
+    first.album = "Playlist"
+    first.covers.set_largest_path("cover.jpg")
+    assert second.album != "Playlist"
+    assert second.covers.largest()[2] is None
+
+
+def test_album_metadata_qobuz_without_release_type():
+    resp = {k: v for k, v in qobuz_album_resp.items() if k != "release_type"}
+    assert AlbumMetadata.from_qobuz(resp).releasetype is None
+
+
+@pytest.mark.parametrize(
+    "copyright, label",
+    [
+        ("(C) 2000 Label Name", "Label Name"),
+        ("(p)2019 Label", "Label"),
+        ("(P) Label Name", "Label Name"),
+        ("(C) 2000", "2000"),
+        ("2000 Label Name", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_label_from_copyright(copyright, label):
+    assert _label_from_copyright(copyright) == label
+
+
+def test_enrich_many_with_rym_limits_concurrency():
+    class FakeRymService:
+        def __init__(self):
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def get_release_metadata(self, artist, album, year, album_type):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+            return None
+
+    service = FakeRymService()
+    albums = [AlbumMetadata.from_qobuz(qobuz_album_resp) for _ in range(5)]
+    arun(AlbumMetadata.enrich_many_with_rym(albums, service, max_concurrency=2))
+    assert service.max_in_flight == 2
+    assert all(album.rym_descriptors == [] for album in albums)
+
+
+@pytest.mark.parametrize(
+    "releasetype, album_type",
+    [("EP", "ep"), ("Best Of", "compilation"), ("live", "album"), (None, "album")],
+)
+def test_map_rym_album_type(releasetype, album_type):
+    assert _map_rym_album_type(releasetype) == album_type
@@ -1,6 +1,8 @@
+import asyncio
 import hashlib
 import logging
 import os
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from util import arun
@@ -188,3 +190,65 @@ def test_qobuz_metadata_integration():
     assert john_count == 1, f"John Darnielle appears {john_count} times, should be 1"
 
 
+@patch("streamrip.client.qobuz.asyncio.sleep", new_callable=AsyncMock)
+def test_api_request_retries_rate_limited_requests(sleep):
+    responses = []
+    for status in (429, 200):
+        resp = MagicMock(status=status)
+        resp.json = AsyncMock(return_value={"status": status})
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=resp)
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        responses.append(ctx)
+    client = QobuzClient(Config.defaults())
+    client.session = MagicMock()
+    client.session.get.side_effect = responses
+
+    assert arun(client._api_request("album/get", {})) == (200, {"status": 200})
+    sleep.assert_awaited_once_with(1)
+
+
+def _favorites_page(offset: int) -> dict:
+    items = [{"id": str(offset + i)} for i in range(2)]
+    return {"tracks": {"total": 6, "limit": 2, "offset": offset, "items": items}}
+
+
+def test_get_user_favorites_returns_items_of_every_page():
+    client = QobuzClient(Config.defaults())
+
+    async def _api_request(epoint, params):
+        return 200, _favorites_page(params.get("offset", 0))
+
+    client._api_request = _api_request
+    resp = arun(client.get_user_favorites("tracks"))
+    assert [item["id"] for item in resp["items"]] == ["0", "1", "2", "3", "4", "5"]
+
+
+def test_iter_user_favorites_cancels_pending_pages_when_closed():
+    client = QobuzClient(Config.defaults())
+    started = []
+
+    async def _api_request(epoint, params):
+        offset = params.get("offset", 0)
+        if offset:
+            started.append(offset)
+            await asyncio.sleep(10)
+        return 200, _favorites_page(offset)
+
+    client._api_request = _api_request
+
+    async def _first_and_close():
+        items = client.iter_user_favorites("tracks")
+        first = await anext(items)
+        # Let the remaining page requests start
+        await asyncio.sleep(0)
+        await items.aclose()
+        # Let the cancelled page requests finish unwinding
+        await asyncio.sleep(0)
+        pending = asyncio.all_tasks() - {asyncio.current_task()}
+        return first, pending
+
+    first, pending = arun(_first_and_close())
+    assert first == {"id": "0"}
+    assert started == [2, 4]
+    assert not pending
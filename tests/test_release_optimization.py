@@ -5,7 +5,7 @@ import os
 from unittest.mock import Mock, AsyncMock
 import pytest
 
-from streamrip.db import Database, Downloads, Failed, DownloadedReleases
+from streamrip.db import Database, Downloads, Dummy, Failed, DownloadedReleases
 from streamrip.media.album import PendingAlbum
 from streamrip.media.artist import PendingArtist
 from streamrip.media.label import PendingLabel
@@ -93,6 +93,49 @@ class TestCoreReleaseOptimization:
         assert temp_database.release_downloaded(release_id, "artist", "qobuz")
         assert not temp_database.release_downloaded(release_id, "artist", "deezer")
 
+    def test_downloaded_many_single_lookup(self, temp_database):
+        """Test that downloaded_many returns exactly the downloaded subset."""
+        for track_id in ("1", "3", "5"):
+            temp_database.set_downloaded(track_id)
+
+        assert temp_database.downloaded_many([1, "2", "3", "4", "5", "5"]) == {"1", "3", "5"}
+        assert temp_database.downloaded_many([]) == set()
+
+        # Larger than one statement's parameter limit
+        ids = [str(i) for i in range(2500)]
+        assert temp_database.downloaded_many(ids) == {"1", "3", "5"}
+
+    def test_downloaded_ids_cached_after_first_lookup(self, temp_database):
+        """Test that downloaded() loads the table once and tracks new downloads."""
+        temp_database.set_downloaded("1")
+        assert temp_database.downloaded(1)
+
+        # Rows written before this Database was created are picked up too
+        reopened = Database(temp_database.downloads, temp_database.failed, temp_database.releases)
+        assert reopened.downloaded("1")
+        assert not reopened.downloaded("2")
+
+        reopened.downloads.all = Mock(side_effect=AssertionError("table re-read"))
+        reopened.set_downloaded("2")
+        assert reopened.downloaded("2")
+        assert reopened.downloaded_many(["1", "2", "3"]) == {"1", "2"}
+
+    def test_downloaded_ids_not_tracked_with_database_disabled(self):
+        """Test that a disabled database never reports ids as downloaded."""
+        database = Database(Dummy(), Dummy(), Dummy())
+        database.set_downloaded("1")
+        assert not database.downloaded("1")
+        assert database.downloaded_many(["1"]) == set()
+
+    def test_releases_downloaded_matches_type_and_source(self, temp_database):
+        """Test that releases_downloaded filters by media type and source."""
+        temp_database.set_release_downloaded("a1", "album", "deezer", 10)
+        temp_database.set_release_downloaded("a2", "album", "qobuz", 10)
+        temp_database.set_release_downloaded("a3", "artist", "deezer", 3)
+
+        assert temp_database.releases_downloaded(["a1", "a2", "a3", "a4"], "album", "deezer") == {"a1"}
+        assert temp_database.releases_downloaded([], "album", "deezer") == set()
+
     @pytest.mark.asyncio
     async def test_artist_new_release_detection(self, temp_database):
         """Test that artists correctly detect and process new releases."""
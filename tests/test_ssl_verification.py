@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from streamrip.client.client import Client
+from streamrip.client.client import Client, close_shared_connectors
 from streamrip.client.qobuz import QobuzSpoofer
 from streamrip.rip.cli import latest_streamrip_version, rip
 from streamrip.utils.ssl_utils import (
@@ -150,6 +150,26 @@ async def test_client_get_session_creates_connector():
         mock_get_kwargs.assert_called_once_with(verify_ssl=False)
 
 
+@pytest.mark.asyncio
+async def test_client_sessions_share_connector_per_ssl_setting():
+    """Test that client sessions share a connection pool but not headers."""
+    first = await Client.get_session(headers={"X-Test": "1"})
+    second = await Client.get_session()
+    insecure = await Client.get_session(verify_ssl=False)
+    try:
+        assert first.connector is second.connector
+        assert insecure.connector is not first.connector
+        assert "X-Test" not in second.headers
+
+        # Closing a session leaves the shared pool open for the others
+        await first.close()
+        assert not second.connector.closed
+    finally:
+        for session in (first, second, insecure):
+            await session.close()
+        await close_shared_connectors()
+
+
 def test_latest_streamrip_version_supports_verify_ssl():
     """Test that latest_streamrip_version supports verify_ssl parameter."""
     # Check if the function accepts the verify_ssl parameter
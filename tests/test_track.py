@@ -1,5 +1,8 @@
+import asyncio
 import os
 import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from util import arun
@@ -31,3 +34,112 @@ def test_pending_resolve(qobuz_client: QobuzClient):
     assert isinstance(t.downloadable, Downloadable)
     assert t.cover_path is not None
     shutil.rmtree(dir)
+
+
+def _track_with_download(side_effect) -> Track:
+    config = MagicMock()
+    config.session.cli.dry_run = False
+    config.session.cli.progress_bars = False
+    downloadable = MagicMock()
+    downloadable.size = AsyncMock(return_value=1024)
+    downloadable.download = AsyncMock(side_effect=side_effect)
+    return Track(MagicMock(), downloadable, config, "folder", None, MagicMock())
+
+
+@patch("streamrip.media.track.DOWNLOAD_RETRY_BACKOFF", 0)
+def test_download_retries_then_succeeds():
+    track = _track_with_download([Exception("reset"), None])
+    arun(track.download())
+    assert track.downloadable.download.await_count == 2
+    # Size is only probed once for both attempts
+    track.downloadable.size.assert_awaited_once()
+    track.db.set_failed.assert_not_called()
+
+
+@patch("streamrip.media.track.DOWNLOAD_RETRY_BACKOFF", 0)
+def test_download_marks_failed_after_last_attempt():
+    track = _track_with_download(Exception("reset"))
+    arun(track.download())
+    assert track.downloadable.download.await_count == 2
+    track.db.set_failed.assert_called_once()
+
+
+def test_albums_sharing_a_track_download_it_once(tmp_path):
+    async def _write(path, _callback):
+        await asyncio.to_thread(Path(path).write_text, "audio")
+
+    tracks = []
+    for album in ("original", "compilation"):
+        track = _track_with_download(_write)
+        track.downloadable.source = "qobuz"
+        track.meta.info.id = "123"
+        track.download_path = str(tmp_path / f"{album}.flac")
+        tracks.append(track)
+
+    async def _download_all():
+        await asyncio.gather(*(track.download() for track in tracks))
+
+    arun(_download_all())
+    downloads = sum(track.downloadable.download.await_count for track in tracks)
+    assert downloads == 1
+    for track in tracks:
+        assert Path(track.download_path).read_text() == "audio"
+
+
+@patch("streamrip.media.track.download_artwork", new_callable=AsyncMock)
+def test_singles_from_same_album_share_cover_download(download_artwork):
+    download_artwork.return_value = ("embed.jpg", None)
+    client = MagicMock(source="qobuz")
+    album = MagicMock()
+    album.info.id = "album1"
+
+    async def _download_covers():
+        singles = [PendingSingle(i, client, MagicMock(), MagicMock()) for i in "12"]
+        return [await s._download_cover(album, "folder") for s in singles]
+
+    assert arun(_download_covers()) == ["embed.jpg", "embed.jpg"]
+    download_artwork.assert_awaited_once()
+
+
+@patch("streamrip.media.track.download_artwork", new_callable=AsyncMock)
+def test_failed_cover_download_is_retried(download_artwork):
+    download_artwork.side_effect = [OSError("reset"), ("embed.jpg", None)]
+    client = MagicMock(source="qobuz")
+    album = MagicMock()
+    album.info.id = "album2"
+
+    async def _download_covers():
+        single = PendingSingle("1", client, MagicMock(), MagicMock())
+        with pytest.raises(OSError):
+            await single._download_cover(album, "folder")
+        return await single._download_cover(album, "folder")
+
+    assert arun(_download_covers()) == "embed.jpg"
+    assert download_artwork.await_count == 2
+
+
+@pytest.mark.parametrize(
+    "codec, expected",
+    [("MP3", ["convert", "tag"]), ("OPUS", ["tag", "convert"])],
+)
+def test_postprocess_tags_converted_file_when_taggable(codec, expected):
+    calls = []
+    config = MagicMock()
+    config.session.cli.dry_run = False
+    config.session.downloads.validate_audio = False
+    config.session.conversion.enabled = True
+    config.session.conversion.codec = codec
+    track = Track(MagicMock(), MagicMock(), config, "folder", None, MagicMock())
+
+    async def _tag(*_):
+        calls.append("tag")
+
+    async def _convert():
+        calls.append("convert")
+
+    with patch("streamrip.media.track.tag_file", _tag), patch.object(
+        Track, "_convert", lambda self: _convert()
+    ):
+        arun(track.postprocess())
+    assert calls == expected
+    track.db.set_downloaded.assert_called_once()
@@ -0,0 +1,34 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from util import arun
+
+from streamrip.media.user_favorites import UserFavorites
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+def test_liked_tracks_expand_to_unique_albums():
+    client = MagicMock(source="qobuz")
+    client.get_metadata = AsyncMock(return_value={"album": {"id": 3}})
+    config = MagicMock()
+    config.session.downloads.download_full_album_for_liked_tracks = True
+    config.session.downloads.max_connections = 2
+    items = [
+        {"id": 10, "album": {"id": 1}},
+        {"id": 11, "album": {"id": 1}},
+        {"id": 12, "album": {"id": 2}},
+        {"id": 13},
+    ]
+    favorites = UserFavorites("user", "tracks", _aiter(items), client, config, MagicMock())
+
+    with patch("streamrip.media.user_favorites.PendingAlbum") as pending_album:
+        pending_album.return_value.resolve = AsyncMock(return_value=None)
+        arun(favorites.download())
+
+    # Only the track without an embedded album needs its metadata fetched
+    client.get_metadata.assert_awaited_once_with("13", "track")
+    album_ids = sorted(call.args[0] for call in pending_album.call_args_list)
+    assert album_ids == ["1", "2", "3"]